@@ -14,25 +14,81 @@ AI World Tracker - MVP版本
 """
 
 import sys
+import argparse
+import copy
 import json
+import fnmatch
 import os
-import glob
+import hashlib
+import importlib
+import platform
+import queue
+import socket
+import subprocess
+import threading
+import time
+import traceback
+import webbrowser
 import yaml
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
 from typing import Optional, Dict
 from getpass import getpass
 
 # 导入自定义模块
-from data_collector import DataCollector
 from content_classifier import ContentClassifier
-from ai_analyzer import AIAnalyzer
-from visualizer import DataVisualizer
-from web_publisher import WebPublisher
-from manual_reviewer import ManualReviewer
-from learning_feedback import LearningFeedback, create_feedback_loop
+from config import get_config, load_yaml_file
 from i18n import set_language, get_language, t, select_language_interactive
 from logger import get_log_helper, configure_logging
 
+# 重量级模块延迟导入（采集器会加载 aiohttp/feedparser/bs4，visualizer 会加载 matplotlib），首次使用时才导入
+_LAZY_IMPORTS = {
+    'DataCollector': 'data_collector',
+    'AIAnalyzer': 'ai_analyzer',
+    'DataVisualizer': 'visualizer',
+    'WebPublisher': 'web_publisher',
+    'ManualReviewer': 'manual_reviewer',
+    'LearningFeedback': 'learning_feedback',
+    'create_feedback_loop': 'learning_feedback',
+}
+
+
+def __getattr__(name: str):
+    """模块级延迟导入（PEP 562），保持 `from TheWorldOfAI import DataVisualizer` 等用法可用"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+class _LazyComponent:
+    """延迟初始化的组件描述符：首次访问时才导入模块并创建实例，也可直接赋值替换"""
+
+    def __init__(self, module_name: str, class_name: str):
+        self.module_name = module_name
+        self.class_name = class_name
+
+    def __set_name__(self, owner, name):
+        self.attr_name = '_' + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        component = instance.__dict__.get(self.attr_name)
+        if component is None:
+            cls = getattr(importlib.import_module(self.module_name), self.class_name)
+            component = cls()
+            instance.__dict__[self.attr_name] = component
+        return component
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.attr_name] = value
+
 # 配置日志
 configure_logging(log_level='INFO')
 
@@ -44,6 +100,12 @@ CONFIG_FILE = 'ai_tracker_config.json'
 
 # Ollama 启动配置
 OLLAMA_STARTUP_TIMEOUT = 10  # 启动等待超时（秒）
+OLLAMA_STARTUP_POLL_INTERVAL = 0.25  # 启动就绪检测初始间隔（秒）
+OLLAMA_STARTUP_POLL_MAX_INTERVAL = 1.0  # 检测间隔退避上限（秒）
+OLLAMA_ADDRESS = ('127.0.0.1', 11434)  # Ollama 服务监听地址
+OLLAMA_PORT_PROBE_TIMEOUT = 0.1  # 端口探测连接超时（秒）
+OLLAMA_STATUS_TTL = 5  # Ollama状态缓存有效期（秒）
+PULL_PROGRESS_INTERVAL = 0.1  # 模型下载进度最短刷新间隔（秒）
 
 # 数据目录配置（从config.yaml加载）
 def _load_data_paths():
@@ -52,12 +114,9 @@ def _load_data_paths():
     cache_dir = 'data/cache'
     
     try:
-        if os.path.exists('config.yaml'):
-            with open('config.yaml', 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                data_config = config.get('data', {})
-                exports_dir = data_config.get('exports_dir', exports_dir)
-                cache_dir = data_config.get('cache_dir', cache_dir)
+        data_config = load_yaml_file('config.yaml').get('data', {})
+        exports_dir = data_config.get('exports_dir', exports_dir)
+        cache_dir = data_config.get('cache_dir', cache_dir)
     except (OSError, yaml.YAMLError, KeyError) as e:
         # 配置文件读取失败，使用默认值
         pass
@@ -70,6 +129,224 @@ def _load_data_paths():
 
 DATA_EXPORTS_DIR, DATA_CACHE_DIR = _load_data_paths()
 
+# 可视化生成的图表（visualizations/<名称>.png）
+CHART_NAMES = ('tech_hotspots', 'content_distribution', 'region_distribution',
+               'daily_trends', 'dashboard')
+
+# orjson（可选导入，C实现的JSON编解码，用于加速数据文件读写）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+
+def _read_json_file(path: str):
+    """读取JSON文件（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=8)
+def _load_report(path: str, mtime_ns: int) -> Dict:
+    """读取学习反馈报告（按路径和修改时间缓存，文件更新后自动失效）"""
+    return _read_json_file(path)
+
+
+# 导出文件写缓冲大小：逐条编码的小块写入先在缓冲区合并，减少write系统调用
+EXPORT_WRITE_BUFFER = 1 << 20
+
+
+def _json_bytes(obj) -> bytes:
+    """将对象编码为紧凑的UTF-8 JSON字节串（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _fingerprint(obj) -> Optional[bytes]:
+    """计算对象内容指纹（紧凑JSON的blake2b摘要），无法序列化时返回None"""
+    try:
+        return hashlib.blake2b(_json_bytes(obj), digest_size=16).digest()
+    except (TypeError, ValueError):
+        return None
+
+
+# 分类器读取的条目字段：这些字段都相同的条目分类结果必然相同，作为去重键
+CLASSIFY_KEY_FIELDS = ('title', 'summary', 'description', 'source', 'url')
+
+
+def _classify_deduplicated(classify_batch, items: list) -> list:
+    """分类器读取的字段完全相同的条目只送分类器一次，再按原顺序映射回结果（重复条目得到独立的深拷贝）"""
+    unique_items = []
+    positions = []
+    seen = {}
+    for item in items:
+        key = tuple(item.get(field) for field in CLASSIFY_KEY_FIELDS)
+        try:
+            pos = seen.get(key)
+        except TypeError:
+            key = id(item)
+            pos = seen.get(key)
+        if pos is None:
+            pos = seen[key] = len(unique_items)
+            unique_items.append(item)
+        positions.append(pos)
+    
+    if len(unique_items) == len(items):
+        return classify_batch(items)
+    
+    log.dual_info(f"🔁 Skipped {len(items) - len(unique_items)} duplicate items before classification")
+    results = classify_batch(unique_items)
+    
+    classified = []
+    used = set()
+    for pos in positions:
+        if pos in used:
+            classified.append(copy.deepcopy(results[pos]))
+        else:
+            used.add(pos)
+            classified.append(results[pos])
+    return classified
+
+
+def _stream_json_export(path: str, metadata: Dict, data: list, trends: Dict) -> None:
+    """流式写入导出文件：逐条编码data列表，避免在内存中构建完整的JSON文档"""
+    with open(path, 'wb', buffering=EXPORT_WRITE_BUFFER) as f:
+        f.write(b'{"metadata":')
+        f.write(_json_bytes(metadata))
+        f.write(b',"data":[')
+        for i, item in enumerate(data):
+            if i:
+                f.write(b',')
+            f.write(_json_bytes(item))
+        f.write(b'],"trends":')
+        f.write(_json_bytes(trends))
+        f.write(b'}')
+
+
+def _write_export_blob(path: str, metadata: Dict, data_blob: bytes, trends: Dict) -> None:
+    """写入导出文件，data部分使用已编码好的JSON字节串，避免重复序列化"""
+    with open(path, 'wb', buffering=EXPORT_WRITE_BUFFER) as f:
+        f.write(b'{"metadata":')
+        f.write(_json_bytes(metadata))
+        f.write(b',"data":')
+        f.write(data_blob)
+        f.write(b',"trends":')
+        f.write(_json_bytes(trends))
+        f.write(b'}')
+
+
+def _group_export_files(**patterns: str) -> Dict[str, list]:
+    """一次扫描导出目录，按通配模式将文件路径分组（等价于对每个模式分别 glob，但只读一次目录）"""
+    groups = {key: [] for key in patterns}
+    try:
+        with os.scandir(DATA_EXPORTS_DIR) as entries:
+            for entry in entries:
+                for key, pattern in patterns.items():
+                    if fnmatch.fnmatch(entry.name, pattern):
+                        groups[key].append(entry.path)
+    except FileNotFoundError:
+        pass
+    return groups
+
+
+# 批量删除：文件数超过阈值时用线程池并发删除（删除系统调用期间释放GIL）
+REMOVE_PARALLEL_THRESHOLD = 32
+REMOVE_MAX_WORKERS = 8
+
+
+def _try_remove(path: str) -> Optional[str]:
+    """删除单个文件，成功（或文件已不存在）返回 None，失败返回错误信息"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        return f"{path}: {e}"
+    return None
+
+
+def _remove_files(paths: list, log_error) -> int:
+    """批量删除文件，返回成功删除的数量；删除失败的文件汇总后通过 log_error 记录一次"""
+    if len(paths) > REMOVE_PARALLEL_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=REMOVE_MAX_WORKERS) as executor:
+            errors = list(executor.map(_try_remove, paths))
+    else:
+        errors = [_try_remove(path) for path in paths]
+    failures = [e for e in errors if e is not None]
+    if failures:
+        log_error(f"Failed to delete {len(failures)} file(s): " + "; ".join(failures))
+    return len(paths) - len(failures)
+
+
+def _ollama_port_open() -> bool:
+    """探测 Ollama 端口是否已开始监听（仅TCP连接，比HTTP状态查询轻量得多）"""
+    try:
+        with socket.create_connection(OLLAMA_ADDRESS, timeout=OLLAMA_PORT_PROBE_TIMEOUT):
+            return True
+    except OSError:
+        return False
+
+
+def _relay_progress(stream, interval: float = PULL_PROGRESS_INTERVAL) -> None:
+    """
+    将子进程输出逐行转发到控制台，缓冲后最多每 interval 秒刷新一次
+    
+    读取放在后台线程：子进程暂时没有新输出时，已缓冲的行也会在间隔到期后输出，
+    不必等下一行到达；流结束后剩余的行立即输出。
+    """
+    lines = queue.Queue()
+    
+    def pump():
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+    
+    threading.Thread(target=pump, daemon=True).start()
+    
+    buffered = []
+    last_flush = 0.0
+    finished = False
+    while not finished:
+        timeout = max(0.0, last_flush + interval - time.monotonic()) if buffered else None
+        try:
+            line = lines.get(timeout=timeout)
+            if line is None:
+                finished = True
+            else:
+                buffered.append(f"  {line.strip()}\n")
+        except queue.Empty:
+            pass
+        if buffered and (finished or time.monotonic() - last_flush >= interval):
+            sys.stdout.write(''.join(buffered))
+            sys.stdout.flush()
+            buffered.clear()
+            last_flush = time.monotonic()
+
+
+def _write_pretty_json(path: str, obj) -> None:
+    """写入缩进的JSON文件，便于人工查看（--pretty）"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        # json.dump 会按编码器分块多次写入，先完整编码再一次写出
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+
+def _write_text_file(path: str, text: str) -> None:
+    """写入UTF-8文本文件"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
 # LLM分类器（可选导入）
 try:
     from llm_classifier import LLMClassifier, check_ollama_status, AVAILABLE_MODELS, LLMProvider
@@ -88,6 +365,14 @@ except ImportError:
 class AIWorldTracker:
     """AI世界追踪器主应用"""
     
+    # 各组件按需初始化，首次访问时才导入对应模块
+    collector = _LazyComponent('data_collector', 'DataCollector')
+    analyzer = _LazyComponent('ai_analyzer', 'AIAnalyzer')
+    visualizer = _LazyComponent('visualizer', 'DataVisualizer')
+    web_publisher = _LazyComponent('web_publisher', 'WebPublisher')
+    reviewer = _LazyComponent('manual_reviewer', 'ManualReviewer')
+    learner = _LazyComponent('learning_feedback', 'LearningFeedback')
+    
     def __init__(self, auto_mode: bool = False):
         """
         初始化AI世界追踪器
@@ -96,21 +381,32 @@ class AIWorldTracker:
             auto_mode: 是否为自动模式，自动模式下跳过交互式提示
         """
         self.auto_mode = auto_mode
+        self.open_browser = True  # 生成Web页面后是否询问在浏览器中打开
+        self.pretty_json = False  # 导出数据文件默认紧凑JSON，--pretty 时缩进输出
+        self._cwd = os.getcwd()  # 启动目录（程序不切换工作目录），用于拼接绝对路径
         
         log.dual_section(f"     {t('app_title')}\n     {t('app_subtitle')}")
         
-        self.collector = DataCollector()
         self.classifier = ContentClassifier()  # 规则分类器
         self.llm_classifier = None  # LLM分类器（按需初始化）
-        self.analyzer = AIAnalyzer()
-        self.visualizer = DataVisualizer()
-        self.web_publisher = WebPublisher()
-        self.reviewer = ManualReviewer()
-        self.learner = LearningFeedback()
-        
+        # 以下组件由 _LazyComponent 按需初始化
+        self._collector = None
+        self._analyzer = None
+        self._visualizer = None
+        self._web_publisher = None
+        self._reviewer = None
+        self._learner = None
+        
+        self._data_version = 0  # 数据版本号，self.data 每次重新赋值时自增
         self.data = []
         self.trends = {}
         self.chart_files = {}
+        self._exports_index = None  # 导出目录文件索引缓存: ((目录, mtime), 索引)
+        self._trends_memo = None  # 趋势分析缓存: (数据版本号, trends)
+        self._charts_memo = None  # 图表缓存: (趋势指纹, chart_files)
+        self._feedback_reports = {}  # 学习反馈报告缓存: (审核文件, mtime, 数据文件, mtime) -> 报告路径
+        self._last_saved_config = None  # 最近一次写入/读取的用户配置: (配置文件, 设置项)
+        self._ollama_status_cache = None  # Ollama状态缓存: (monotonic时间, status)
         
         # 分类模式: 'rule' 或 'llm'
         self.classification_mode = 'rule'
@@ -139,31 +435,34 @@ class AIWorldTracker:
     def _load_user_config(self):
         """加载用户配置（包括上次的分类模式选择）"""
         try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    
-                # 恢复分类模式设置
-                saved_mode = config.get('classification_mode', 'rule')
-                saved_provider = config.get('llm_provider', 'ollama')
-                saved_model = config.get('llm_model', 'qwen3:8b')
+            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                config = json.load(f)
                 
-                # 验证模式有效性
-                if saved_mode in ['rule', 'llm']:
-                    self.classification_mode = saved_mode
-                    self.llm_provider = saved_provider
-                    self.llm_model = saved_model
-                    
-                    if saved_mode == 'llm':
-                        log.config(t('config_loaded_llm', provider=saved_provider, model=saved_model))
-                    else:
-                        log.config(t('config_loaded_rule'))
+            # 恢复分类模式设置
+            saved_mode = config.get('classification_mode', 'rule')
+            saved_provider = config.get('llm_provider', 'ollama')
+            saved_model = config.get('llm_model', 'qwen3:8b')
+            
+            # 验证模式有效性
+            if saved_mode in ['rule', 'llm']:
+                self.classification_mode = saved_mode
+                self.llm_provider = saved_provider
+                self.llm_model = saved_model
+                self._last_saved_config = (CONFIG_FILE, (saved_mode, saved_provider, saved_model))
+                
+                if saved_mode == 'llm':
+                    log.config(t('config_loaded_llm', provider=saved_provider, model=saved_model))
+                else:
+                    log.config(t('config_loaded_rule'))
         except (FileNotFoundError, json.JSONDecodeError, KeyError):
             # 配置文件损坏或不存在，使用默认值
             pass
     
     def _save_user_config(self):
-        """保存用户配置"""
+        """保存用户配置（设置未变化时跳过写入，临时文件+替换保证原子性）"""
+        saved = (CONFIG_FILE, (self.classification_mode, self.llm_provider, self.llm_model))
+        if saved == self._last_saved_config:
+            return
         try:
             config = {
                 'classification_mode': self.classification_mode,
@@ -171,8 +470,10 @@ class AIWorldTracker:
                 'llm_model': self.llm_model,
                 'last_updated': datetime.now().isoformat()
             }
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            tmp_file = CONFIG_FILE + '.tmp'
+            _write_pretty_json(tmp_file, config)
+            os.replace(tmp_file, CONFIG_FILE)
+            self._last_saved_config = saved
         except Exception as e:
             log.error(t('config_save_failed', error=str(e)))
     
@@ -189,12 +490,13 @@ class AIWorldTracker:
             except Exception as e:
                 log.warning(f"Failed to cleanup LLM classifier: {e}")
         
-        # 2. 保存采集历史缓存
-        try:
-            log.dual_info("  ↳ Saving collection history cache...")
-            self.collector._save_history_cache()
-        except Exception as e:
-            log.warning(f"Failed to save history cache: {e}")
+        # 2. 保存采集历史缓存（采集器未初始化时无需保存）
+        if self._collector is not None:
+            try:
+                log.dual_info("  ↳ Saving collection history cache...")
+                self._collector._save_history_cache()
+            except Exception as e:
+                log.warning(f"Failed to save history cache: {e}")
         
         log.dual_success("✅ Resource cleanup completed")
     
@@ -212,13 +514,16 @@ class AIWorldTracker:
                     
                 # 检查Ollama服务是否可用
                 if self.llm_provider == 'ollama':
-                    status = check_ollama_status()
+                    status = self._ollama_status()
                     if status['running'] and self.llm_model in status.get('models', []):
                         self.llm_classifier = LLMClassifier(
                             provider='ollama',
-                            model=self.llm_model
+                            model=self.llm_model,
+                            batch_size=get_config().classifier.batch_size
                         )
                         log.dual_success(t('llm_restored', model=self.llm_model))
+                        # 后台预热模型，与菜单交互并行，首次分类无需等待模型加载
+                        threading.Thread(target=self.llm_classifier.warmup_model, daemon=True).start()
                     else:
                         log.dual_warning(t('llm_restore_failed'))
                         self.classification_mode = 'rule'
@@ -232,15 +537,37 @@ class AIWorldTracker:
                 self.classification_mode = 'rule'
                 self._save_user_config()
     
+    def _enable_llm_non_interactive(self, model: Optional[str] = None):
+        """非交互启用Ollama分类（--mode llm）；服务或模型不可用时保持规则模式，且不改写用户配置"""
+        if not LLM_AVAILABLE or LLMClassifier is None:
+            log.dual_warning(t('llm_not_installed'))
+            return
+        
+        status = self._ollama_status()
+        model = model or status.get('recommended') or self.llm_model
+        if not status['running'] or model not in status.get('models', []):
+            log.dual_warning(t('llm_restore_failed'))
+            return
+        
+        self.llm_provider = 'ollama'
+        self.llm_model = model
+        self.llm_classifier = LLMClassifier(
+            provider='ollama',
+            model=model,
+            batch_size=get_config().classifier.batch_size
+        )
+        self.classification_mode = 'llm'
+        log.dual_success(t('llm_restored', model=model))
+    
     def _force_clear_llm_cache(self):
         """强制清除LLM分类缓存文件和内存缓存"""
         cache_file = os.path.join(DATA_CACHE_DIR, 'llm_classification_cache.json')
         try:
             # 1. 清除磁盘缓存文件
-            if os.path.exists(cache_file):
+            try:
                 os.remove(cache_file)
                 log.success(t('llm_cache_force_cleared'))
-            else:
+            except FileNotFoundError:
                 log.info(t('llm_cache_not_found'), emoji="ℹ️")
             
             # 2. 清除内存缓存（如果LLM分类器已初始化）
@@ -253,14 +580,10 @@ class AIWorldTracker:
     
     def _clear_export_history(self):
         """清除采集结果历史（需要用户确认）"""
-        import glob
-        
         # 查找所有导出文件
-        json_pattern = os.path.join(DATA_EXPORTS_DIR, 'ai_tracker_data_*.json')
-        txt_pattern = os.path.join(DATA_EXPORTS_DIR, 'ai_tracker_report_*.txt')
-        
-        json_files = glob.glob(json_pattern)
-        txt_files = glob.glob(txt_pattern)
+        files = _group_export_files(json='ai_tracker_data_*.json', txt='ai_tracker_report_*.txt')
+        json_files = files['json']
+        txt_files = files['txt']
         all_files = json_files + txt_files
         
         if not all_files:
@@ -278,13 +601,7 @@ class AIWorldTracker:
             return
         
         # 执行删除
-        deleted_count = 0
-        for f in all_files:
-            try:
-                os.remove(f)
-                deleted_count += 1
-            except Exception as e:
-                log.error(f"Failed to delete {f}: {e}")
+        deleted_count = _remove_files(all_files, log.error)
         
         # 清空内存中的数据
         self.data = []
@@ -295,14 +612,10 @@ class AIWorldTracker:
     
     def _clear_review_history(self):
         """清除人工审核记录和学习报告（需要用户确认）"""
-        import glob
-        
         # 查找所有审核历史和学习报告文件
-        review_pattern = os.path.join(DATA_EXPORTS_DIR, 'review_history_*.json')
-        learning_pattern = os.path.join(DATA_EXPORTS_DIR, 'learning_report_*.json')
-        
-        review_files = glob.glob(review_pattern)
-        learning_files = glob.glob(learning_pattern)
+        files = _group_export_files(review='review_history_*.json', learning='learning_report_*.json')
+        review_files = files['review']
+        learning_files = files['learning']
         all_files = review_files + learning_files
         
         if not all_files:
@@ -320,20 +633,12 @@ class AIWorldTracker:
             return
         
         # 执行删除
-        deleted_count = 0
-        for f in all_files:
-            try:
-                os.remove(f)
-                deleted_count += 1
-            except Exception as e:
-                log.dual_error(f"Failed to delete {f}: {e}")
+        deleted_count = _remove_files(all_files, log.dual_error)
         
         log.dual_success(t('clear_review_history_done', count=deleted_count))
     
     def _clear_all_data(self):
         """清除所有数据（需要用户二次确认）"""
-        import glob
-        
         # 显示严重警告
         log.dual_separator()
         log.dual_warning(t('clear_all_data_confirm'))
@@ -355,13 +660,14 @@ class AIWorldTracker:
         
         # 1. 清除LLM分类缓存
         cache_file = os.path.join(DATA_CACHE_DIR, 'llm_classification_cache.json')
-        if os.path.exists(cache_file):
-            try:
-                os.remove(cache_file)
-                deleted_total += 1
-                log.dual_success(t('llm_cache_force_cleared'))
-            except Exception as e:
-                log.dual_error(f"Failed to delete LLM cache: {e}")
+        try:
+            os.remove(cache_file)
+            deleted_total += 1
+            log.dual_success(t('llm_cache_force_cleared'))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.dual_error(f"Failed to delete LLM cache: {e}")
         
         # 同时清除内存中的LLM分类缓存
         if self.llm_classifier:
@@ -374,30 +680,18 @@ class AIWorldTracker:
         deleted_total += 1
         log.dual_info(t('collection_cache_cleared'), emoji="✓")
         
-        # 3. 清除采集结果历史
-        json_pattern = os.path.join(DATA_EXPORTS_DIR, 'ai_tracker_data_*.json')
-        txt_pattern = os.path.join(DATA_EXPORTS_DIR, 'ai_tracker_report_*.txt')
-        export_files = glob.glob(json_pattern) + glob.glob(txt_pattern)
-        for f in export_files:
-            try:
-                os.remove(f)
-                deleted_total += 1
-            except Exception as e:
-                log.dual_error(f"Failed to delete {f}: {e}")
+        # 3. 清除采集结果历史（与步骤4共用一次目录扫描）
+        files = _group_export_files(json='ai_tracker_data_*.json', txt='ai_tracker_report_*.txt',
+                                    review='review_history_*.json', learning='learning_report_*.json')
+        export_files = files['json'] + files['txt']
+        deleted_total += _remove_files(export_files, log.dual_error)
         
         if export_files:
             log.dual_info(f"Export history cleared ({len(export_files)} files)", emoji="✓")
         
         # 4. 清除人工审核记录
-        review_pattern = os.path.join(DATA_EXPORTS_DIR, 'review_history_*.json')
-        learning_pattern = os.path.join(DATA_EXPORTS_DIR, 'learning_report_*.json')
-        review_files = glob.glob(review_pattern) + glob.glob(learning_pattern)
-        for f in review_files:
-            try:
-                os.remove(f)
-                deleted_total += 1
-            except Exception as e:
-                log.dual_error(f"Failed to delete {f}: {e}")
+        review_files = files['review'] + files['learning']
+        deleted_total += _remove_files(review_files, log.dual_error)
         
         if review_files:
             log.dual_info(f"Review history cleared ({len(review_files)} files)", emoji="✓")
@@ -413,7 +707,7 @@ class AIWorldTracker:
     
     def _check_llm_availability(self):
         """检查LLM服务可用性，提供启动帮助"""
-        status = check_ollama_status()
+        status = self._ollama_status()
         
         if status['running']:
             if status['models']:
@@ -442,6 +736,16 @@ class AIWorldTracker:
             log.warning(t('ollama_not_running_info'))
             self._offer_ollama_startup_help()
     
+    def _ollama_status(self, max_age: float = OLLAMA_STATUS_TTL) -> dict:
+        """获取Ollama状态，max_age 秒内复用上次结果（传 0 强制重新检测）"""
+        now = time.monotonic()
+        cached = self._ollama_status_cache
+        if cached is not None and now - cached[0] < max_age:
+            return cached[1]
+        status = check_ollama_status()
+        self._ollama_status_cache = (now, status)
+        return status
+    
     def _start_ollama_service(self, show_progress: bool = True) -> dict:
         """
         启动 Ollama 服务的核心逻辑（公共方法）
@@ -456,36 +760,30 @@ class AIWorldTracker:
                 'error': str|None     # 错误类型: 'timeout', 'not_found', 或具体错误信息
             }
         """
-        import subprocess
-        import platform
-        import time
-        
         try:
-            # 根据操作系统选择启动方式
-            system = platform.system()
-            if system == 'Windows':
-                subprocess.Popen(
-                    ['ollama', 'serve'],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-            else:
-                subprocess.Popen(
-                    ['ollama', 'serve'],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    start_new_session=True
-                )
+            # 根据操作系统选择启动方式：仅脱离控制台的参数不同
+            detach = ({'creationflags': subprocess.CREATE_NO_WINDOW} if platform.system() == 'Windows'
+                      else {'start_new_session': True})
+            subprocess.Popen(['ollama', 'serve'], stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, **detach)
             
-            # 等待服务启动
-            for _ in range(OLLAMA_STARTUP_TIMEOUT):
-                time.sleep(1)
-                if show_progress:
+            # 等待服务启动：端口未监听前只做TCP探测；端口打开后再查询HTTP状态，
+            # 未就绪时查询间隔指数退避，就绪后立即返回
+            start = time.monotonic()
+            deadline = start + OLLAMA_STARTUP_TIMEOUT
+            interval = OLLAMA_STARTUP_POLL_INTERVAL
+            dots = 0
+            while time.monotonic() < deadline:
+                time.sleep(interval)
+                if _ollama_port_open():
+                    status = self._ollama_status(max_age=0)
+                    if status['running']:
+                        return {'success': True, 'status': status, 'error': None}
+                    interval = min(interval * 2, OLLAMA_STARTUP_POLL_MAX_INTERVAL)
+                # 进度点仍按每秒一个输出
+                if show_progress and int(time.monotonic() - start) > dots:
+                    dots += 1
                     print('.', end='', flush=True)
-                status = check_ollama_status()
-                if status['running']:
-                    return {'success': True, 'status': status, 'error': None}
             
             return {'success': False, 'status': None, 'error': 'timeout'}
             
@@ -565,8 +863,6 @@ class AIWorldTracker:
     
     def _install_ollama_model(self, model_name: str):
         """安装Ollama模型"""
-        import subprocess
-        
         print("\n" + t('model_installing', model=model_name))
         log.info(t('model_install_wait'), emoji="⏳")
         print()
@@ -581,9 +877,9 @@ class AIWorldTracker:
                 bufsize=1
             )
             
+            # 进度行较多，缓冲后定时输出，减少逐行刷新
             if process.stdout:
-                for line in process.stdout:
-                    print(f"  {line.strip()}")
+                _relay_progress(process.stdout)
             
             process.wait()
             
@@ -598,36 +894,119 @@ class AIWorldTracker:
         except Exception as e:
             print("\n" + t('model_install_error', error=str(e)))
     
+    @property
+    def data(self) -> list:
+        """当前数据列表（重新赋值时数据版本号自增；更新数据须整体赋值，不要原地修改）"""
+        return self._data
+    
+    @data.setter
+    def data(self, value: list):
+        self._data = value
+        self._data_version += 1
+    
+    def _analyze_trends(self) -> Dict:
+        """分析当前数据的趋势；数据版本未变化时直接复用上次的结果"""
+        version = self._data_version
+        if self._trends_memo is not None and self._trends_memo[0] == version:
+            return self._trends_memo[1]
+        trends = self.analyzer.analyze_trends(self.data)
+        self._trends_memo = (version, trends)
+        return trends
+    
+    def _visualize_all(self) -> Dict:
+        """根据当前趋势生成图表；趋势未变化且图表文件仍在时直接复用"""
+        key = _fingerprint(self.trends)
+        if key is not None and self._charts_memo and self._charts_memo[0] == key:
+            chart_files = self._charts_memo[1]
+            if all(os.path.exists(path) for path in chart_files.values()):
+                return chart_files
+        chart_files = self.visualizer.visualize_all(self.trends)
+        self._charts_memo = (key, chart_files) if key is not None else None
+        return chart_files
+    
+    def _visualize_changed(self, previous_trends: Dict) -> Dict:
+        """重新生成图表，趋势中对应数据未变化且文件仍在的图表直接沿用（仪表板汇总全部数据，任一变化即重绘）"""
+        if self.trends is previous_trends:
+            unchanged = CHART_NAMES
+        else:
+            unchanged = [key for key in CHART_NAMES
+                         if key != 'dashboard' and key in previous_trends
+                         and previous_trends.get(key) == self.trends.get(key)]
+        reuse = {key: self.chart_files[key] for key in unchanged
+                 if self.chart_files.get(key) and os.path.exists(self.chart_files[key])}
+        chart_files = self.visualizer.visualize_all(self.trends, reuse=reuse)
+        key = _fingerprint(self.trends)
+        self._charts_memo = (key, chart_files) if key is not None else None
+        return chart_files
+    
+    def _scan_exports(self) -> Dict:
+        """
+        单次扫描导出目录，按文件名前缀归类（以目录mtime为键缓存，目录未变化时直接复用）
+        
+        Returns:
+            dict: {
+                'data': ai_tracker_data_*.json（含审核后数据）,
+                'reviewed': ai_tracker_data_reviewed_*.json,
+                'reviews': review_history_*.json,
+                'latest_data': 修改时间最新的数据文件（无则为None）
+            }，各列表为完整路径，按文件名倒序（最新在前）
+        """
+        try:
+            cache_key = (DATA_EXPORTS_DIR, os.stat(DATA_EXPORTS_DIR).st_mtime_ns)
+        except FileNotFoundError:
+            return {'data': [], 'reviewed': [], 'reviews': [], 'latest_data': None}
+        
+        if self._exports_index is not None and self._exports_index[0] == cache_key:
+            return self._exports_index[1]
+        
+        data, reviewed, reviews = [], [], []
+        latest_data, latest_key = None, None
+        with os.scandir(DATA_EXPORTS_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.json'):
+                    continue
+                if name.startswith('ai_tracker_data_'):
+                    data.append(entry.path)
+                    if name.startswith('ai_tracker_data_reviewed_'):
+                        reviewed.append(entry.path)
+                    # 按修改时间取最新（同一遍历中完成，无需排序）
+                    key = (entry.stat().st_mtime_ns, name)
+                    if latest_key is None or key > latest_key:
+                        latest_data, latest_key = entry.path, key
+                elif name.startswith('review_history_'):
+                    reviews.append(entry.path)
+        
+        for paths in (data, reviewed, reviews):
+            paths.sort(reverse=True)
+        
+        index = {'data': data, 'reviewed': reviewed, 'reviews': reviews, 'latest_data': latest_data}
+        
+        self._exports_index = (cache_key, index)
+        return index
+    
     def _load_latest_data(self):
         """尝试加载最新的数据文件"""
         try:
-            # 从 exports 目录加载数据
-            if not os.path.exists(DATA_EXPORTS_DIR):
-                return
-            files = [f for f in os.listdir(DATA_EXPORTS_DIR) if f.startswith('ai_tracker_data_') and f.endswith('.json')]
-            if not files:
+            # 从 exports 目录加载数据（目录不存在时扫描结果为空）
+            latest_file = self._scan_exports()['latest_data']
+            if latest_file is None:
                 return
-            
-            latest_file = os.path.join(DATA_EXPORTS_DIR, max(files))
             log.data(t('loading_history', file=os.path.basename(latest_file)))
             
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                saved_data = json.load(f)
-                
+            saved_data = _read_json_file(latest_file)
             self.data = saved_data.get('data', [])
             self.trends = saved_data.get('trends', {})
             
-            # 尝试加载图表文件
-            if os.path.exists('visualizations'):
-                self.chart_files = {
-                    'tech_hotspots': os.path.join('visualizations', 'tech_hotspots.png'),
-                    'content_distribution': os.path.join('visualizations', 'content_distribution.png'),
-                    'region_distribution': os.path.join('visualizations', 'region_distribution.png'),
-                    'daily_trends': os.path.join('visualizations', 'daily_trends.png'),
-                    'dashboard': os.path.join('visualizations', 'dashboard.png')
-                }
-                # 验证文件是否存在
-                self.chart_files = {k: v for k, v in self.chart_files.items() if os.path.exists(v)}
+            # 尝试加载图表文件（一次目录读取代替逐个 os.path.exists）
+            try:
+                with os.scandir('visualizations') as entries:
+                    names = {entry.name for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            if names:
+                self.chart_files = {k: os.path.join('visualizations', f'{k}.png')
+                                    for k in CHART_NAMES if f'{k}.png' in names}
             
             log.dual_success(t('history_loaded', count=len(self.data)))
         except Exception as e:
@@ -651,7 +1030,6 @@ class AIWorldTracker:
           * 历史缓存: collection_history_cache.json 持久化
         - 分类器: 仅负责分类结果缓存，避免重复调用LLM
         """
-        import time
         start_time = time.time()
         timing_stats = {}  # 收集耗时统计
         
@@ -666,9 +1044,7 @@ class AIWorldTracker:
         raw_data = self.collector.collect_all()
         
         # 合并所有新采集的数据（采集器已完成去重，直接合并）
-        new_items = []
-        for category, items in raw_data.items():
-            new_items.extend(items)
+        new_items = list(chain.from_iterable(raw_data.values()))
         
         timing_stats['data_collection'] = round(time.time() - step_start, 1)
         log.data(t('collected_items', count=len(new_items)))
@@ -697,27 +1073,30 @@ class AIWorldTracker:
         # 步骤4: 智能分析
         step_start = time.time()
         log.step(3, 5, t('step_analyze'))
-        self.trends = self.analyzer.analyze_trends(self.data)
+        self.trends = self._analyze_trends()
         timing_stats['analysis'] = round(time.time() - step_start, 1)
         
-        # 步骤5: 数据可视化
-        step_start = time.time()
-        log.step(4, 5, t('step_visualize'))
-        self.chart_files = self.visualizer.visualize_all(self.trends)
-        timing_stats['visualization'] = round(time.time() - step_start, 1)
-        
-        # 步骤6: 生成Web页面
-        step_start = time.time()
-        log.step(5, 5, t('step_web'))
-        log.step(5, 5, t('step_web'))
-        web_file = self.web_publisher.generate_html_page(self.data, self.trends, self.chart_files)
-        timing_stats['web_generation'] = round(time.time() - step_start, 1)
-        
-        # 计算总耗时
-        timing_stats['total'] = round(time.time() - start_time, 1)
-        
-        # 生成报告
-        report = self.analyzer.generate_report(self.data, self.trends)
+        # 文本报告只依赖数据和趋势，在后台线程生成，与图表和Web页面生成重叠
+        analyzer = self.analyzer
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            report_future = executor.submit(analyzer.generate_report, self.data, self.trends)
+            
+            # 步骤5: 数据可视化
+            step_start = time.time()
+            log.step(4, 5, t('step_visualize'))
+            self.chart_files = self._visualize_all()
+            timing_stats['visualization'] = round(time.time() - step_start, 1)
+            
+            # 步骤6: 生成Web页面
+            step_start = time.time()
+            log.step(5, 5, t('step_web'))
+            web_file = self.web_publisher.generate_html_page(self.data, self.trends, self.chart_files)
+            timing_stats['web_generation'] = round(time.time() - step_start, 1)
+            
+            # 计算总耗时
+            timing_stats['total'] = round(time.time() - start_time, 1)
+            
+            report = report_future.result()
         
         # 保存数据和报告（包含耗时统计）
         self._save_results(report, web_file, timing_stats)
@@ -737,36 +1116,38 @@ class AIWorldTracker:
     
     def show_menu(self):
         """显示交互菜单"""
+        # 菜单选项 -> 处理函数（字典分发）
+        menu_actions = {
+            '1': self.run_full_pipeline,
+            '2': self._generate_web_page,
+            '3': self._manual_review,
+            '4': self._learning_feedback,
+            '5': self._switch_classification_mode,
+        }
+        # 菜单选项文本在循环中不变，只翻译一次
+        menu_lines = [t(key) for key in ('menu_option_1', 'menu_option_2', 'menu_option_3',
+                                         'menu_option_4', 'menu_option_5', 'menu_option_0')]
+        
         while True:
             # 显示当前分类模式
             mode_str = self._get_mode_display()
             
             log.dual_section(t('menu_title') + f"\n   {t('menu_current_mode')}: {mode_str}")
-            log.menu(t('menu_option_1'))
-            log.menu(t('menu_option_2'))
-            log.menu(t('menu_option_3'))
-            log.menu(t('menu_option_4'))
-            log.menu(t('menu_option_5'))
-            log.menu(t('menu_option_0'))
+            for line in menu_lines:
+                log.menu(line)
             log.dual_separator()
             
             choice = input(f"\n{t('menu_choice')}: ").strip()
             
-            if choice == '1':
-                self.run_full_pipeline()
-            elif choice == '2':
-                self._generate_web_page()
-            elif choice == '3':
-                self._manual_review()
-            elif choice == '4':
-                self._learning_feedback()
-            elif choice == '5':
-                self._switch_classification_mode()
-            elif choice == '0':
+            if choice == '0':
                 log.dual_success(t('menu_goodbye'))
                 break
-            else:
+            
+            action = menu_actions.get(choice)
+            if action is None:
                 log.warning(t('menu_invalid'))
+            else:
+                action()
     
     def _get_mode_display(self) -> str:
         """获取当前模式的显示字符串"""
@@ -847,14 +1228,14 @@ class AIWorldTracker:
     
     def _setup_ollama_mode(self):
         """设置Ollama模式"""
-        status = check_ollama_status()
+        status = self._ollama_status()
         
         if not status['running']:
             log.warning(t('ollama_not_running'))
             self._offer_ollama_startup_help_in_menu()
             
             # 重新检查状态
-            status = check_ollama_status()
+            status = self._ollama_status(max_age=0)
             if not status['running']:
                 log.error(t('ollama_cannot_connect'))
                 return
@@ -872,7 +1253,7 @@ class AIWorldTracker:
             if choice == 'y':
                 self._install_ollama_model('qwen3:8b')
                 # 重新获取模型列表
-                status = check_ollama_status()
+                status = self._ollama_status(max_age=0)
                 models = status['models']
             
             if not models:
@@ -909,7 +1290,7 @@ class AIWorldTracker:
                 model=selected_model,
                 enable_cache=True,
                 max_workers=3,  # 默认并发数，GPU模式自动提升至6
-                batch_size=5    # 启用批量分类
+                batch_size=get_config().classifier.batch_size  # 批量分类（config.yaml classification.batch_size）
             )
             self._save_user_config()
             log.success(t('switched_to_llm', provider='Ollama', model=selected_model))
@@ -918,7 +1299,8 @@ class AIWorldTracker:
             warmup_prompt = "\nWarm up the model now? (Y/n): " if get_language() == 'en' else "\n是否现在预热模型? (Y/n): "
             warmup = input(warmup_prompt).strip().lower()
             if warmup != 'n':
-                self.llm_classifier.warmup_model()
+                # 后台预热，立即返回菜单；分类时若预热未完成会等待同一把预热锁
+                threading.Thread(target=self.llm_classifier.warmup_model, daemon=True).start()
                 
         except Exception as e:
             log.error(t('llm_init_failed', error=str(e)))
@@ -1026,7 +1408,8 @@ class AIWorldTracker:
                 azure_endpoint=endpoint,
                 azure_api_version=api_version,
                 enable_cache=True,
-                max_workers=3
+                max_workers=3,
+                batch_size=get_config().classifier.batch_size
             )
             self._save_user_config()
             log.success(t('switched_to_llm', provider='Azure OpenAI', model=deployment_name))
@@ -1099,21 +1482,19 @@ class AIWorldTracker:
         """根据当前模式分类数据"""
         if self.classification_mode == 'llm' and self.llm_classifier:
             print(f"\n" + t('using_llm', provider=self.llm_provider, model=self.llm_model))
-            return self.llm_classifier.classify_batch(items)
+            return _classify_deduplicated(self.llm_classifier.classify_batch, items)
         else:
             print("\n" + t('using_rule'))
-            return self.classifier.classify_batch(items)
+            return _classify_deduplicated(self.classifier.classify_batch, items)
     
     def _collect_only(self):
         """仅采集数据"""
         print("\n" + t('collecting') + "\n")
         raw_data = self.collector.collect_all()
         
-        all_items = []
-        for items in raw_data.values():
-            all_items.extend(items)
+        all_items = list(chain.from_iterable(raw_data.values()))
         
-        self.data = self.classifier.classify_batch(all_items)
+        self.data = _classify_deduplicated(self.classifier.classify_batch, all_items)
         print(f"\n" + t('collect_done', count=len(self.data)))
     
     def _show_statistics(self):
@@ -1125,22 +1506,17 @@ class AIWorldTracker:
         print("\n" + t('stats_overview'))
         print("   " + t('stats_total', count=len(self.data)))
         
-        # 内容类型统计
-        type_count = {}
+        # 内容类型和地区统计（一次遍历同时计数）
+        type_count = Counter()
+        region_count = Counter()
         for item in self.data:
-            ct = item.get('content_type', 'unknown')
-            type_count[ct] = type_count.get(ct, 0) + 1
+            type_count[item.get('content_type', 'unknown')] += 1
+            region_count[item.get('region', 'unknown')] += 1
         
         print("\n   " + t('stats_by_type'))
         for ctype, count in type_count.items():
             print("   " + t('stats_item', name=ctype, count=count))
         
-        # 地区统计
-        region_count = {}
-        for item in self.data:
-            region = item.get('region', 'unknown')
-            region_count[region] = region_count.get(region, 0) + 1
-        
         print("\n   " + t('stats_by_region'))
         for region, count in region_count.items():
             print("   " + t('stats_item', name=region, count=count))
@@ -1153,10 +1529,10 @@ class AIWorldTracker:
         
         if not self.trends:
             print("\n" + t('analyzing'))
-            self.trends = self.analyzer.analyze_trends(self.data)
+            self.trends = self._analyze_trends()
         
         print("\n" + t('generating_charts'))
-        self.chart_files = self.visualizer.visualize_all(self.trends)
+        self.chart_files = self._visualize_all()
     
     def _show_report(self):
         """显示分析报告"""
@@ -1166,7 +1542,7 @@ class AIWorldTracker:
         
         if not self.trends:
             print("\n" + t('generating_analysis'))
-            self.trends = self.analyzer.analyze_trends(self.data)
+            self.trends = self._analyze_trends()
         
         report = self.analyzer.generate_report(self.data, self.trends)
         print("\n" + report)
@@ -1188,49 +1564,56 @@ class AIWorldTracker:
         if filter_choice == '1':
             ctype_prompt = "Enter content type (research/product/market): " if get_language() == 'en' else "输入内容类型 (research/product/market): "
             ctype = input(ctype_prompt).strip()
-            filtered = self.classifier.get_filtered_items(self.data, content_type=ctype)
+            filtered = self.classifier.iter_filtered_items(self.data, content_type=ctype)
         elif filter_choice == '2':
             region_prompt = "Enter region (China/USA/Europe/Global): " if get_language() == 'en' else "输入地区 (China/USA/Europe/Global): "
             region = input(region_prompt).strip()
-            filtered = self.classifier.get_filtered_items(self.data, region=region)
+            filtered = self.classifier.iter_filtered_items(self.data, region=region)
         elif filter_choice == '3':
             tech_prompt = "Enter tech field (e.g., NLP, Computer Vision): " if get_language() == 'en' else "输入技术领域 (如: NLP, Computer Vision): "
             tech = input(tech_prompt).strip()
-            filtered = self.classifier.get_filtered_items(self.data, tech_category=tech)
+            filtered = self.classifier.iter_filtered_items(self.data, tech_category=tech)
         else:
             log.warning(t('invalid_choice'))
             return
         
-        print(f"\n" + t('filter_result', count=len(filtered)) + "\n")
+        # 只物化前5条用于显示，其余匹配项仅计数
+        first_items = list(islice(filtered, 5))
+        total = len(first_items) + sum(1 for _ in filtered)
+        
+        print(f"\n" + t('filter_result', count=total) + "\n")
         
         # 显示前5条
-        for i, item in enumerate(filtered[:5], 1):
+        type_label = "Type" if get_language() == 'en' else "类型"
+        region_label = "Region" if get_language() == 'en' else "地区"
+        source_label = "Source" if get_language() == 'en' else "来源"
+        date_label = "Date" if get_language() == 'en' else "日期"
+        for i, item in enumerate(first_items, 1):
             print(f"{i}. {item.get('title', 'No title')}")
-            type_label = "Type" if get_language() == 'en' else "类型"
-            region_label = "Region" if get_language() == 'en' else "地区"
-            source_label = "Source" if get_language() == 'en' else "来源"
-            date_label = "Date" if get_language() == 'en' else "日期"
             print(f"   {type_label}: {item.get('content_type')} | {region_label}: {item.get('region')}")
             print(f"   {source_label}: {item.get('source')} | {date_label}: {item.get('published', 'N/A')}\n")
         
-        if len(filtered) > 5:
-            print("   " + t('filter_more', count=len(filtered) - 5))
+        if total > 5:
+            print("   " + t('filter_more', count=total - 5))
     
     def _ask_open_web_page(self, web_file: str):
         """询问用户是否在浏览器中打开网页"""
         if not web_file or not os.path.exists(web_file):
             return
+        # 自动模式或 --no-browser 时不阻塞等待输入
+        if self.auto_mode or not self.open_browser:
+            return
         
+        abs_path = self._abs_path(web_file)
         try:
-            import webbrowser
             prompt = "\nOpen web page in browser? (Y/N): " if get_language() == 'en' else "\n是否在浏览器中打开Web页面? (Y/N): "
             choice = input(prompt).strip().lower()
             if choice in ['y', 'yes', '是']:
-                webbrowser.open(f'file://{os.path.abspath(web_file)}')
+                webbrowser.open(f'file://{abs_path}')
                 log.success(t('opened_browser'))
         except Exception as e:
             log.error(t('browser_error', error=str(e)))
-            log.info(t('manual_open', file=os.path.abspath(web_file)), emoji="📄")
+            log.info(t('manual_open', file=abs_path), emoji="📄")
     
     def _generate_web_page(self):
         """生成Web页面"""
@@ -1240,11 +1623,11 @@ class AIWorldTracker:
         
         if not self.trends:
             print("\n" + t('generating_analysis'))
-            self.trends = self.analyzer.analyze_trends(self.data)
+            self.trends = self._analyze_trends()
         
         if not self.chart_files:
             print("\n" + t('generating_charts'))
-            self.chart_files = self.visualizer.visualize_all(self.trends)
+            self.chart_files = self._visualize_all()
         
         print("\n" + t('generating_web'))
         web_file = self.web_publisher.generate_html_page(self.data, self.trends, self.chart_files)
@@ -1293,24 +1676,21 @@ class AIWorldTracker:
         
         if choice == '1':
             # 批量审核
-            self.data = self.reviewer.batch_review(self.data, min_confidence=0.6)
+            self.data = self.reviewer.batch_review(self.data, min_confidence=0.6, review_items=review_items)
             
             # 保存审核后的数据
             save_prompt = "\nSave reviewed data? (Y/N): " if get_language() == 'en' else "\n是否保存审核后的数据? (Y/N): "
             save = input(save_prompt).strip().lower()
+            # 保存和重新生成都会写出审核后的数据，data只编码一次供两次写入共用
+            data_blob = None if self.pretty_json else _json_bytes(self.data)
             if save == 'y':
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 filename = os.path.join(DATA_EXPORTS_DIR, f'ai_tracker_data_reviewed_{timestamp}.json')
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump({
-                        'metadata': {
-                            'timestamp': timestamp,
-                            'total_items': len(self.data),
-                            'reviewed': True
-                        },
-                        'data': self.data,
-                        'trends': self.trends
-                    }, f, ensure_ascii=False, indent=2)
+                self._write_export(filename, {
+                    'timestamp': timestamp,
+                    'total_items': len(self.data),
+                    'reviewed': True
+                }, data_blob)
                 log.file(t('review_saved', file=os.path.basename(filename)))
             
             # 保存审核历史
@@ -1328,7 +1708,7 @@ class AIWorldTracker:
             regen_prompt = "\nRegenerate report and web page based on reviewed data? (Y/N): " if get_language() == 'en' else "\n是否基于审核后的数据重新生成报告和Web页面? (Y/N): "
             regenerate = input(regen_prompt).strip().lower()
             if regenerate == 'y':
-                self._regenerate_after_review()
+                self._regenerate_after_review(data_blob, changed_indices=self.reviewer.last_changed_indices)
         
         elif choice == '2':
             # 自定义阈值
@@ -1344,59 +1724,98 @@ class AIWorldTracker:
         
         elif choice == '3':
             # 仅查看列表
-            print("\n" + "="*70)
-            print(t('review_list_title'))
-            print("="*70)
-            cat_label = "Category" if get_language() == 'en' else "分类"
-            conf_label = "Confidence" if get_language() == 'en' else "置信度"
-            source_label = "Source" if get_language() == 'en' else "来源"
-            for i, item in enumerate(review_items, 1):
-                print(f"\n[{i}] {item.get('title', 'N/A')}")
-                print(f"    {cat_label}: {item.get('content_type')} | {conf_label}: {item.get('confidence', 0):.1%}")
-                print(f"    {source_label}: {item.get('source', 'N/A')}")
+            self._show_review_list(review_items)
         
         elif choice == '0':
             return
         else:
             log.warning(t('invalid_choice'))
     
-    def _regenerate_after_review(self):
-        """审核后重新生成分析和Web页面"""
+    def _abs_path(self, path: str) -> str:
+        """基于启动目录求绝对路径（等价于 os.path.abspath，但不必每次调用 getcwd）"""
+        return os.path.normpath(os.path.join(self._cwd, path))
+    
+    def _write_export(self, path: str, metadata: Dict, data_blob: Optional[bytes] = None):
+        """写入导出数据文件：默认紧凑JSON（data_blob 为调用方已编码的data，可省去重复编码），--pretty 时缩进输出"""
+        if self.pretty_json:
+            _write_pretty_json(path, {'metadata': metadata, 'data': self.data, 'trends': self.trends})
+        else:
+            if data_blob is None:
+                data_blob = _json_bytes(self.data)
+            _write_export_blob(path, metadata, data_blob, self.trends)
+    
+    def _show_review_list(self, review_items: list):
+        """打印待审核内容的完整列表"""
+        print("\n" + "="*70)
+        print(t('review_list_title'))
+        print("="*70)
+        cat_label = "Category" if get_language() == 'en' else "分类"
+        conf_label = "Confidence" if get_language() == 'en' else "置信度"
+        source_label = "Source" if get_language() == 'en' else "来源"
+        # 待审核内容可能有数百条，拼好后一次输出
+        lines = []
+        for i, item in enumerate(review_items, 1):
+            lines.append(f"\n[{i}] {item.get('title', 'N/A')}")
+            lines.append(f"    {cat_label}: {item.get('content_type')} | {conf_label}: {item.get('confidence', 0):.1%}")
+            lines.append(f"    {source_label}: {item.get('source', 'N/A')}")
+        if lines:
+            print('\n'.join(lines))
+    
+    def _regenerate_after_review(self, data_blob: Optional[bytes] = None, reviewed: bool = True,
+                                 changed_indices: Optional[set] = None):
+        """
+        审核后重新生成分析和Web页面
+        
+        Args:
+            data_blob: 已编码的审核后data（审核保存时已编码则直接复用）
+            reviewed: 数据是否经过人工审核；否（如 --regenerate 单独使用）时按普通导出保存
+            changed_indices: 审核中统计字段有变化的条目位置；为空集时沿用现有趋势和图表，
+                None 表示变化未知，完整重新分析
+        """
         print("\n" + "="*60)
         print(t('regenerate_title'))
         print("="*60)
         
         try:
-            # 步骤1: 重新分析
+            # 步骤1: 重新分析（审核没有改动任何统计字段时沿用现有趋势）
             print("\n" + t('regenerate_step1'))
-            self.trends = self.analyzer.analyze_trends(self.data)
-            
-            # 步骤2: 重新生成图表
-            log.step(2, 3, t('regenerate_step2'))
-            self.chart_files = self.visualizer.visualize_all(self.trends)
-            
-            # 步骤3: 重新生成Web页面
-            log.step(3, 3, t('regenerate_step3'))
-            web_file = self.web_publisher.generate_html_page(self.data, self.trends, self.chart_files)
+            previous_trends = self.trends
+            if changed_indices is not None and not changed_indices and self.trends:
+                self._trends_memo = (self._data_version, self.trends)
+            else:
+                self.trends = self._analyze_trends()
             
-            # 生成报告
-            report = self.analyzer.generate_report(self.data, self.trends)
+            # 文本报告只依赖数据和趋势，在后台线程生成，与图表和Web页面生成重叠
+            analyzer = self.analyzer
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                report_future = executor.submit(analyzer.generate_report, self.data, self.trends)
+                
+                # 步骤2: 重新生成图表（审核后只渲染趋势数据有变化的图表）
+                log.step(2, 3, t('regenerate_step2'))
+                if changed_indices is not None:
+                    self.chart_files = self._visualize_changed(previous_trends)
+                else:
+                    self.chart_files = self._visualize_all()
+                
+                # 步骤3: 重新生成Web页面（页面引用图表文件，需在图表之后）
+                log.step(3, 3, t('regenerate_step3'))
+                web_file = self.web_publisher.generate_html_page(self.data, self.trends, self.chart_files)
+                abs_web = self._abs_path(web_file)
+                
+                report = report_future.result()
             
-            # 保存（使用reviewed标记）
+            # 保存（审核后的数据使用reviewed标记，未审核时按普通导出命名）
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            data_file = os.path.join(DATA_EXPORTS_DIR, f'ai_tracker_data_reviewed_{timestamp}.json')
-            with open(data_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'metadata': {
-                        'timestamp': timestamp,
-                        'total_items': len(self.data),
-                        'reviewed': True
-                    },
-                    'data': self.data,
-                    'trends': self.trends
-                }, f, ensure_ascii=False, indent=2)
+            prefix = 'reviewed_' if reviewed else ''
+            metadata = {'timestamp': timestamp, 'total_items': len(self.data)}
+            if reviewed:
+                metadata['reviewed'] = True
+            else:
+                metadata['classification_mode'] = self.classification_mode
+            data_file = os.path.join(DATA_EXPORTS_DIR, f'ai_tracker_data_{prefix}{timestamp}.json')
+            self._write_export(data_file, metadata, data_blob)
             
-            report_file = os.path.join(DATA_EXPORTS_DIR, f'ai_tracker_report_reviewed_{timestamp}.txt')
+            report_file = os.path.join(DATA_EXPORTS_DIR, f'ai_tracker_report_{prefix}{timestamp}.txt')
             with open(report_file, 'w', encoding='utf-8') as f:
                 f.write(report)
             
@@ -1405,12 +1824,13 @@ class AIWorldTracker:
             print("   " + t('regenerate_report', file=os.path.basename(report_file)))
             print("   " + t('regenerate_web', file=web_file))
             
-            # 询问是否打开
-            import webbrowser
+            # 询问是否打开（自动模式或 --no-browser 时跳过）
+            if self.auto_mode or not self.open_browser:
+                return
             open_prompt = "\nOpen updated web page in browser? (Y/N): " if get_language() == 'en' else "\n是否在浏览器中打开更新后的Web页面? (Y/N): "
             choice = input(open_prompt).strip().lower()
             if choice == 'y':
-                webbrowser.open(f'file://{os.path.abspath(web_file)}')
+                webbrowser.open(f'file://{abs_web}')
                 log.success(t('regenerate_opened'))
         
         except Exception as e:
@@ -1422,12 +1842,10 @@ class AIWorldTracker:
         print(t('learning_title'))
         print("="*60)
         
-        # 查找审核历史文件和审核后数据文件（都在 data/exports 目录）
-        review_pattern = os.path.join(DATA_EXPORTS_DIR, 'review_history_*.json')
-        review_files = sorted(glob.glob(review_pattern), reverse=True)
-        # 从 exports 目录查找审核后的数据文件
-        data_pattern = os.path.join(DATA_EXPORTS_DIR, 'ai_tracker_data_reviewed_*.json')
-        data_files = sorted(glob.glob(data_pattern), reverse=True)
+        # 查找审核历史文件和审核后数据文件（都在 data/exports 目录，共用一次目录扫描）
+        exports = self._scan_exports()
+        review_files = exports['reviews']
+        data_files = exports['reviewed']
         
         if not review_files:
             print("\n" + t('learning_no_history'))
@@ -1445,7 +1863,7 @@ class AIWorldTracker:
         
         # 显示最近的文件
         print(f"\n" + t('learning_recent'))
-        for i, (review_file, data_file) in enumerate(zip(review_files[:3], data_files[:3]), 1):
+        for i, (review_file, data_file) in enumerate(islice(zip(review_files, data_files), 3), 1):
             print(f"   {i}. {review_file}")
         
         print("\n" + t('learning_options'))
@@ -1464,11 +1882,7 @@ class AIWorldTracker:
             print(f"\n" + t('learning_analyzing', file=review_file))
             
             try:
-                report_file = create_feedback_loop(
-                    review_file,
-                    data_file,
-                    self.classifier
-                )
+                report_file = self._run_feedback_loop(review_file, data_file)
                 
                 print(f"\n" + t('learning_done'))
                 log.file(t('learning_report', file=report_file))
@@ -1495,11 +1909,7 @@ class AIWorldTracker:
                     review_file = review_files[idx]
                     data_file = data_files[idx] if idx < len(data_files) else data_files[0]
                     
-                    report_file = create_feedback_loop(
-                        review_file,
-                        data_file,
-                        self.classifier
-                    )
+                    report_file = self._run_feedback_loop(review_file, data_file)
                     
                     print(f"\n" + t('learning_done') + " " + t('learning_report', file=report_file))
                 else:
@@ -1512,11 +1922,24 @@ class AIWorldTracker:
         else:
             log.warning(t('invalid_choice'))
     
+    def _run_feedback_loop(self, review_file: str, data_file: str) -> str:
+        """执行学习反馈流程；输入文件未变化且报告仍存在时直接返回上次生成的报告"""
+        key = (review_file, os.stat(review_file).st_mtime_ns,
+               data_file, os.stat(data_file).st_mtime_ns)
+        report_file = self._feedback_reports.get(key)
+        if report_file and os.path.exists(report_file):
+            log.info(f"Input files unchanged, reusing {os.path.basename(report_file)}")
+            return report_file
+        
+        from learning_feedback import create_feedback_loop
+        report_file = create_feedback_loop(review_file, data_file, self.classifier)
+        self._feedback_reports[key] = report_file
+        return report_file
+    
     def _show_improvement_suggestions(self, report_file: str):
         """显示改进建议"""
         try:
-            with open(report_file, 'r', encoding='utf-8') as f:
-                report = json.load(f)
+            report = _load_report(report_file, os.stat(report_file).st_mtime_ns)
             
             suggestions = report.get('improvement_suggestions', [])
             
@@ -1528,25 +1951,28 @@ class AIWorldTracker:
             log.info(t('learning_suggestions'), emoji="💡")
             print("="*70)
             
+            # 先拼好全部建议再一次输出
+            lines = []
             for i, sug in enumerate(suggestions, 1):
-                print(f"\n" + t('learning_sug_num', i=i))
-                print("   " + t('learning_sug_type', type=sug.get('type')))
+                lines.append("\n" + t('learning_sug_num', i=i))
+                lines.append("   " + t('learning_sug_type', type=sug.get('type')))
                 
                 if sug.get('category'):
-                    print("   " + t('learning_sug_cat', cat=sug.get('category')))
+                    lines.append("   " + t('learning_sug_cat', cat=sug.get('category')))
                 
                 if sug.get('issue'):
-                    print("   " + t('learning_sug_issue', issue=sug.get('issue')))
+                    lines.append("   " + t('learning_sug_issue', issue=sug.get('issue')))
                 
                 if sug.get('suggestion'):
-                    print("   " + t('learning_sug_suggestion', suggestion=sug.get('suggestion')))
+                    lines.append("   " + t('learning_sug_suggestion', suggestion=sug.get('suggestion')))
                 
                 if sug.get('keywords'):
                     keywords_str = ', '.join(sug['keywords'])
-                    print("   " + t('learning_sug_keywords', keywords=keywords_str))
+                    lines.append("   " + t('learning_sug_keywords', keywords=keywords_str))
                 
                 if sug.get('severity'):
-                    print("   " + t('learning_sug_severity', severity=sug.get('severity')))
+                    lines.append("   " + t('learning_sug_severity', severity=sug.get('severity')))
+            print('\n'.join(lines))
             
             print("\n" + "="*70)
             log.info(t('learning_note'), emoji="📝")
@@ -1577,34 +2003,67 @@ class AIWorldTracker:
             metadata['llm_provider'] = self.llm_provider
             metadata['llm_model'] = self.llm_model
         
-        # 保存JSON数据到 exports 目录
+        # JSON数据和文本报告都保存到 exports 目录，两个文件并行写入
         data_file = os.path.join(DATA_EXPORTS_DIR, f'ai_tracker_data_{timestamp}.json')
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'metadata': metadata,
-                'data': self.data,
-                'trends': self.trends
-            }, f, ensure_ascii=False, indent=2)
-        
-        log.data(t('data_saved_to', file=os.path.basename(data_file)))
-        
-        # 保存文本报告到 exports 目录
         report_file = os.path.join(DATA_EXPORTS_DIR, f'ai_tracker_report_{timestamp}.txt')
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if self.pretty_json:
+                data_future = executor.submit(_write_pretty_json, data_file,
+                                              {'metadata': metadata, 'data': self.data, 'trends': self.trends})
+            else:
+                data_future = executor.submit(_stream_json_export, data_file, metadata, self.data, self.trends)
+            report_future = executor.submit(_write_text_file, report_file, report)
+            data_future.result()
+            report_future.result()
         
+        log.data(t('data_saved_to', file=os.path.basename(data_file)))
         log.file(t('report_saved_to', file=os.path.basename(report_file)))
         
         if web_file:
             log.web(t('web_saved_to', file=web_file))
 
 
+def _confidence_threshold(value: str) -> float:
+    """argparse 类型检查：置信度阈值必须在 0.0-1.0 之间"""
+    threshold = float(value)
+    if not 0 <= threshold <= 1:
+        raise argparse.ArgumentTypeError(f"{value} is not in range 0.0-1.0")
+    return threshold
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    """解析命令行参数（帮助信息由 --help 按当前语言输出）"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--auto', action='store_true')
+    parser.add_argument('--review', action='store_true')
+    parser.add_argument('--threshold', type=_confidence_threshold)
+    parser.add_argument('--regenerate', action='store_true')
+    parser.add_argument('--no-browser', action='store_true')
+    parser.add_argument('--pretty', action='store_true')
+    parser.add_argument('--mode', choices=['rule', 'llm'])
+    parser.add_argument('--model')
+    parser.add_argument('--help', action='store_true')
+    args = parser.parse_args(argv)
+    if args.model and args.mode != 'llm':
+        parser.error('--model requires --mode llm')
+    # 以下参数只在对应模式下生效，静默忽略会让用户误以为已生效
+    if args.mode and not (args.auto or args.review or args.regenerate):
+        parser.error('--mode requires --auto, --review or --regenerate')
+    if args.threshold is not None and not args.review:
+        parser.error('--threshold requires --review')
+    if args.threshold is None:
+        args.threshold = 0.6
+    return args
+
+
 def main():
     """主函数"""
     tracker = None
     try:
-        # 检查是否为自动模式
-        auto_mode = '--auto' in sys.argv
+        args = _parse_args()
+        
+        # --auto/--review/--regenerate 均为非交互模式，不等待任何输入
+        auto_mode = args.auto or args.review or args.regenerate
         
         # 语言设置：自动模式强制英文，交互模式让用户选择
         if auto_mode:
@@ -1613,16 +2072,37 @@ def main():
             select_language_interactive()
         
         tracker = AIWorldTracker(auto_mode=auto_mode)
+        tracker.open_browser = not args.no_browser
+        tracker.pretty_json = args.pretty
+        if auto_mode and args.mode == 'llm':
+            tracker._enable_llm_non_interactive(args.model)
         
         # 检查命令行参数
-        if '--auto' in sys.argv:
-            # 自动运行完整流程
-            tracker.run_full_pipeline()
-        elif '--help' in sys.argv:
+        if auto_mode:
+            if args.auto:
+                # 自动运行完整流程
+                tracker.run_full_pipeline()
+            if args.review:
+                review_items = tracker.reviewer.get_items_for_review(tracker.data, min_confidence=args.threshold)
+                tracker._show_review_list(review_items)
+            if args.regenerate:
+                if tracker.data:
+                    # 未执行审核，按普通导出保存，避免被学习反馈当作审核结果
+                    tracker._regenerate_after_review(reviewed=False)
+                else:
+                    print("\n" + t('no_data'))
+        elif args.help:
             print(f"\n{t('app_title')} - {t('help_usage')}")
             print(f"\n{t('help_params')}")
-            print(f"  --auto    {t('help_auto')}")
-            print(f"  --help    {t('help_info')}")
+            print(f"  --auto          {t('help_auto')}")
+            print(f"  --review        {t('help_review')}")
+            print(f"  --threshold N   {t('help_threshold')}")
+            print(f"  --regenerate    {t('help_regenerate')}")
+            print(f"  --no-browser    {t('help_no_browser')}")
+            print(f"  --pretty        {t('help_pretty')}")
+            print(f"  --mode M        {t('help_mode')}")
+            print(f"  --model NAME    {t('help_model')}")
+            print(f"  --help          {t('help_info')}")
             print(f"\n{t('help_no_params')}\n")
         else:
             # 交互式菜单
@@ -1637,7 +2117,6 @@ def main():
             print("⚠️ 用户中断程序")
     except Exception as e:
         print(f"\n" + t('program_error', error=str(e)))
-        import traceback
         traceback.print_exc()
         sys.exit(1)
     finally:
@@ -13,6 +13,7 @@
 
 import os
 import yaml
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -21,6 +22,30 @@ from logger import get_log_helper
 # 模块日志器
 log = get_log_helper('config')
 
+# 优先使用 libyaml 的C实现解析YAML，不可用时回退纯Python实现
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=4)
+def _parse_yaml_file(path: str, mtime_ns: int) -> Dict:
+    """解析YAML文件（按路径和修改时间缓存）"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+def load_yaml_file(path: str = 'config.yaml') -> Dict:
+    """
+    读取YAML配置文件，各模块共享同一份解析结果，文件修改后自动重新解析
+    
+    Returns:
+        配置字典（共享对象，调用方不应修改）；文件不存在时返回空字典
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    return _parse_yaml_file(os.path.abspath(path), mtime_ns)
+
 
 @dataclass
 class OllamaConfig:
@@ -72,6 +97,9 @@ class ClassifierConfig:
     # 并发配置
     max_workers: int = 3
     
+    # 批量分类每批条数（一次LLM调用分类多条）
+    batch_size: int = 5
+    
     # 自动降级
     auto_fallback: bool = True
 
@@ -127,8 +155,7 @@ class ConfigManager:
         config_file = Path(self._config_path)
         if config_file.exists():
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f) or {}
+                return load_yaml_file(str(config_file))
             except Exception as e:
                 log.warning(f"加载YAML配置失败: {e}")
         return {}
@@ -182,6 +209,8 @@ class ConfigManager:
                 enable_cache=os.getenv('ENABLE_CACHE', 'true').lower() == 'true',
                 max_workers=int(os.getenv('MAX_WORKERS', 
                     str(self._get_yaml_value('classification.max_workers', 3)))),
+                batch_size=int(os.getenv('LLM_BATCH_SIZE',
+                    str(self._get_yaml_value('classification.batch_size', 5)))),
             ),
             collector=CollectorConfig(
                 product_count=self._get_yaml_value('collector.product_count', 10),
@@ -8,7 +8,7 @@
 重要性评估器 ImportanceEvaluator 已迁移到独立模块 importance_evaluator.py
 """
 
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Iterable, Iterator
 import re
 import math
 from datetime import datetime, timedelta
@@ -1151,6 +1151,31 @@ class ContentClassifier:
             filtered = [item for item in filtered if item.get('region') == region]
         
         return filtered
+    
+    def iter_filtered_items(self, items: Iterable[Dict],
+                            content_type: Optional[str] = None,
+                            tech_category: Optional[str] = None,
+                            region: Optional[str] = None) -> Iterator[Dict]:
+        """
+        根据条件惰性过滤内容（生成器版本，只需前N条结果时可提前停止）
+        
+        Args:
+            items: 分类后的内容列表
+            content_type: 内容类型过滤
+            tech_category: 技术领域过滤
+            region: 地区过滤
+            
+        Yields:
+            满足所有条件的内容
+        """
+        for item in items:
+            if content_type and item.get('content_type') != content_type:
+                continue
+            if tech_category and tech_category not in item.get('tech_categories', []):
+                continue
+            if region and item.get('region') != region:
+                continue
+            yield item
 
 
 if __name__ == "__main__":
@@ -27,7 +27,7 @@ import hashlib
 from urllib.parse import urlparse
 from warnings import filterwarnings
 from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
-from config import config
+from config import config, load_yaml_file
 from logger import get_log_helper
 
 # 导入国际化模块
@@ -45,10 +45,8 @@ def _get_cache_dir():
     """获取缓存目录路径"""
     cache_dir = 'data/cache'
     try:
-        if os.path.exists('config.yaml'):
-            with open('config.yaml', 'r', encoding='utf-8') as f:
-                cfg = yaml.safe_load(f)
-                cache_dir = cfg.get('data', {}).get('cache_dir', cache_dir)
+        cfg = load_yaml_file('config.yaml')
+        cache_dir = cfg.get('data', {}).get('cache_dir', cache_dir)
     except (OSError, yaml.YAMLError, KeyError) as e:
         # 配置文件读取失败，使用默认值
         pass
@@ -87,17 +85,15 @@ def _load_async_config() -> AsyncCollectorConfig:
     """从 config.yaml 加载异步采集配置"""
     cfg = AsyncCollectorConfig()
     try:
-        if os.path.exists('config.yaml'):
-            with open('config.yaml', 'r', encoding='utf-8') as f:
-                yaml_cfg = yaml.safe_load(f)
-                async_cfg = yaml_cfg.get('async_collector', {})
-                
-                cfg.max_concurrent_requests = async_cfg.get('max_concurrent_requests', cfg.max_concurrent_requests)
-                cfg.max_concurrent_per_host = async_cfg.get('max_concurrent_per_host', cfg.max_concurrent_per_host)
-                cfg.request_timeout = async_cfg.get('request_timeout', cfg.request_timeout)
-                cfg.total_timeout = async_cfg.get('total_timeout', cfg.total_timeout)
-                cfg.max_retries = async_cfg.get('max_retries', cfg.max_retries)
-                cfg.cache_dir = yaml_cfg.get('data', {}).get('cache_dir', cfg.cache_dir)
+        yaml_cfg = load_yaml_file('config.yaml')
+        async_cfg = yaml_cfg.get('async_collector', {})
+        
+        cfg.max_concurrent_requests = async_cfg.get('max_concurrent_requests', cfg.max_concurrent_requests)
+        cfg.max_concurrent_per_host = async_cfg.get('max_concurrent_per_host', cfg.max_concurrent_per_host)
+        cfg.request_timeout = async_cfg.get('request_timeout', cfg.request_timeout)
+        cfg.total_timeout = async_cfg.get('total_timeout', cfg.total_timeout)
+        cfg.max_retries = async_cfg.get('max_retries', cfg.max_retries)
+        cfg.cache_dir = yaml_cfg.get('data', {}).get('cache_dir', cfg.cache_dir)
     except (OSError, yaml.YAMLError, KeyError) as e:
         # 配置加载失败，使用默认配置
         pass
@@ -110,6 +110,13 @@ LANG_PACKS = {
         'help_params': '参数:',
         'help_auto': '自动运行完整流程 (英文输出)',
         'help_info': '显示帮助信息',
+        'help_review': '列出需要审核的低置信度内容 (非交互)',
+        'help_threshold': '审核置信度阈值 (0.0-1.0, 默认 0.6)',
+        'help_regenerate': '基于最新数据重新生成分析、图表和Web页面 (非交互)',
+        'help_no_browser': '不询问是否在浏览器中打开Web页面',
+        'help_pretty': '导出数据文件使用缩进格式 (默认紧凑JSON)',
+        'help_mode': '非交互模式的分类方式: rule 或 llm (默认 rule)',
+        'help_model': '配合 --mode llm 指定Ollama模型 (默认推荐模型)',
         'help_no_params': '无参数:     进入交互式菜单',
         
         # 模型安装
@@ -523,6 +530,13 @@ LANG_PACKS = {
         'help_params': 'Parameters:',
         'help_auto': 'Run full pipeline automatically (English output)',
         'help_info': 'Show help information',
+        'help_review': 'List low-confidence items that need review (non-interactive)',
+        'help_threshold': 'Confidence threshold for review (0.0-1.0, default 0.6)',
+        'help_regenerate': 'Regenerate analysis, charts and web page from the latest data (non-interactive)',
+        'help_no_browser': 'Do not ask to open the web page in a browser',
+        'help_pretty': 'Write data exports as indented JSON (compact by default)',
+        'help_mode': 'Classification in non-interactive mode: rule or llm (default rule)',
+        'help_model': 'Ollama model to use with --mode llm (default: recommended model)',
         'help_no_params': 'No parameters: Enter interactive menu',
         
         # Model installation
@@ -837,13 +851,18 @@ LANG_PACKS = {
 }
 
 
+# 当前语言包（切换语言时更新，t() 直接查表）
+_current_pack = LANG_PACKS[_current_language]
+
+
 def set_language(lang: str):
     """设置当前语言"""
-    global _current_language
+    global _current_language, _current_pack
     if lang in LANG_PACKS:
         _current_language = lang
     else:
         _current_language = 'en'  # 默认英文
+    _current_pack = LANG_PACKS[_current_language]
 
 
 def get_language() -> str:
@@ -862,8 +881,7 @@ def t(key: str, **kwargs) -> str:
     Returns:
         翻译后的字符串
     """
-    lang_pack = LANG_PACKS.get(_current_language, LANG_PACKS['en'])
-    text = lang_pack.get(key, key)
+    text = _current_pack.get(key, key)
     if kwargs:
         try:
             text = text.format(**kwargs)
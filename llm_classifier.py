@@ -32,6 +32,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 # 导入规则分类器作为备份
+from config import load_yaml_file
 from content_classifier import ContentClassifier
 from importance_evaluator import ImportanceEvaluator
 from logger import get_log_helper
@@ -144,10 +145,8 @@ def _get_cache_dir():
     """获取缓存目录路径"""
     cache_dir = 'data/cache'
     try:
-        if os.path.exists('config.yaml'):
-            with open('config.yaml', 'r', encoding='utf-8') as f:
-                cfg = yaml.safe_load(f)
-                cache_dir = cfg.get('data', {}).get('cache_dir', cache_dir)
+        cfg = load_yaml_file('config.yaml')
+        cache_dir = cfg.get('data', {}).get('cache_dir', cache_dir)
     except (OSError, yaml.YAMLError, KeyError) as e:
         # 配置加载失败，使用默认值
         pass
@@ -164,6 +163,11 @@ OLLAMA_WARMUP_TIMEOUT = 180  # 预热超时（模型首次加载可能很慢）
 OLLAMA_SINGLE_REQUEST_TIMEOUT = 120  # 单条分类超时
 OLLAMA_BATCH_REQUEST_TIMEOUT = 150  # 批量分类超时
 
+# 批量分类的token预算估算（按上下文窗口限制每批条数，避免提示词被截断）
+BATCH_PROMPT_BASE_TOKENS = 900  # 批量提示词固定指令部分
+BATCH_ITEM_OVERHEAD_TOKENS = 15  # 每条内容的编号、字段名等格式开销
+BATCH_ITEM_OUTPUT_TOKENS = 90  # 每条结果的输出JSON
+
 # 统一的 LLM System Prompt（所有提供商使用相同的系统提示）
 LLM_SYSTEM_PROMPT = "你是一个专业的AI内容分类助手，请严格按照JSON格式输出分类结果。"
 
@@ -414,6 +418,8 @@ class LLMClassifier:
         # 缓存
         self.cache: Dict[str, Dict] = {}
         self.cache_file = os.path.join(DATA_CACHE_DIR, 'llm_classification_cache.json')
+        self._cache_dirty = False  # 上次保存后是否写入过新的分类结果
+        self._saved_cache_len: Optional[int] = None  # 上次保存/加载时的缓存条目数
         self._load_cache()
         
         # 规则分类器（作为备份）
@@ -427,6 +433,7 @@ class LLMClassifier:
         
         # 模型预热状态
         self.is_warmed_up = False
+        self._warmup_lock = threading.Lock()  # 后台预热与首次分类互斥，避免重复加载
         self._keep_alive_timer: Optional[threading.Timer] = None
         
         # 统计
@@ -519,10 +526,14 @@ class LLMClassifier:
             self.is_warmed_up = True
             return True
         
-        if self.is_warmed_up:
-            log.dual_info("✅ " + t('llm_model_warmed'))
-            return True
-        
+        with self._warmup_lock:
+            if self.is_warmed_up:
+                log.dual_info("✅ " + t('llm_model_warmed'))
+                return True
+            return self._load_model()
+    
+    def _load_model(self) -> bool:
+        """向Ollama发送最小请求以加载模型（调用方需持有 _warmup_lock）"""
         log.dual_ai(t('llm_warming_model', model=self.model))
         start_time = time.time()
         
@@ -691,6 +702,7 @@ class LLMClassifier:
                         return
                 
                 self.cache = loaded_cache
+                self._saved_cache_len = len(self.cache)
                 log.dual_data(t('llm_cache_loaded', count=len(self.cache)))
             except Exception as e:
                 print(f"⚠️ Cache load failed: {e}")
@@ -702,12 +714,19 @@ class LLMClassifier:
                 self.cache = {}
     
     def _save_cache(self):
-        """保存缓存"""
+        """保存缓存（自上次保存后没有新结果时跳过整文件重写）"""
         if not self.enable_cache:
             return
+        if (not self._cache_dirty and self._saved_cache_len == len(self.cache)
+                and os.path.exists(self.cache_file)):
+            return
         try:
+            # 缓存文件只供程序读取，使用紧凑格式并一次写出
+            text = json.dumps(self.cache, ensure_ascii=False, separators=(',', ':'))
             with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
+                f.write(text)
+            self._cache_dirty = False
+            self._saved_cache_len = len(self.cache)
         except Exception as e:
             log.error(t('llm_cache_save_failed', error=str(e)))
     
@@ -1023,7 +1042,12 @@ START from id=1, classify ALL {len(items)} items:"""
             is_batch: 是否为批量分类模式（需要更多输出tokens）
         """
         if self.ollama_options:
-            num_predict = self.ollama_options.num_predict_batch if is_batch else self.ollama_options.num_predict
+            if is_batch:
+                # 输出长度随每批条数增长，至少保留配置值
+                num_predict = max(self.ollama_options.num_predict_batch,
+                                  self.batch_size * BATCH_ITEM_OUTPUT_TOKENS)
+            else:
+                num_predict = self.ollama_options.num_predict
             return {
                 'temperature': self.ollama_options.temperature,
                 'num_predict': num_predict,
@@ -1350,6 +1374,7 @@ START from id=1, classify ALL {len(items)} items:"""
             
             # 保存到缓存（多模型共存：不同模型的结果分别存储）
             if self.enable_cache:
+                self._cache_dirty = True
                 self.cache[cache_key] = {
                     'content_type': classified['content_type'],
                     'confidence': classified['confidence'],
@@ -1524,21 +1549,50 @@ START from id=1, classify ALL {len(items)} items:"""
         
         return result
     
+    @staticmethod
+    def _estimate_item_tokens(item: Dict) -> int:
+        """估算单条内容在批量提示词中的输入token数（截断方式与 _build_batch_prompt 一致）"""
+        text = (item.get('title', '')[:80]
+                + item.get('summary', item.get('description', ''))[:120]
+                + item.get('source', '')[:20])
+        # 英文约4字符/token，中文等非ASCII字符约1字符/token
+        non_ascii = sum(1 for ch in text if ord(ch) > 127)
+        return (len(text) - non_ascii) // 4 + non_ascii + BATCH_ITEM_OVERHEAD_TOKENS
+    
+    def _pack_batches(self, items: List[Dict], indices: List[int]) -> List[Tuple[List[Dict], List[int]]]:
+        """按输入长度分箱：长度相近的内容放在同一批，Ollama 下按 num_ctx 预算装箱，每批不超过 batch_size 条"""
+        budget = None
+        if self.provider == LLMProvider.OLLAMA:
+            num_ctx = self.ollama_options.num_ctx if self.ollama_options else 2048
+            budget = num_ctx - BATCH_PROMPT_BASE_TOKENS
+        
+        costs = [self._estimate_item_tokens(item) + BATCH_ITEM_OUTPUT_TOKENS for item in items]
+        batches = []
+        batch_items, batch_indices, used = [], [], 0
+        for i in sorted(range(len(items)), key=costs.__getitem__):
+            full = len(batch_items) >= self.batch_size or (budget is not None and used + costs[i] > budget)
+            if batch_items and full:
+                batches.append((batch_items, batch_indices))
+                batch_items, batch_indices, used = [], [], 0
+            batch_items.append(items[i])
+            batch_indices.append(indices[i])
+            used += costs[i]
+        if batch_items:
+            batches.append((batch_items, batch_indices))
+        return batches
+    
     def _classify_batch_mode(self, items: List[Dict], indices: List[int], 
                              show_progress: bool) -> List[Tuple[int, Dict]]:
         """批量分类模式：一次LLM调用处理多条内容"""
         results = []
         total = len(items)
-        total_batches = (total + self.batch_size - 1) // self.batch_size
+        batches = self._pack_batches(items, indices)
+        total_batches = len(batches)
         
-        # 分批处理
-        batch_num = 0
-        for batch_start in range(0, total, self.batch_size):
-            batch_num += 1
+        # 分批处理（结果带原始索引，最终按索引恢复顺序）
+        completed = 0
+        for batch_num, (batch_items, batch_indices) in enumerate(batches, 1):
             batch_start_time = time.time()
-            batch_end = min(batch_start + self.batch_size, total)
-            batch_items = items[batch_start:batch_end]
-            batch_indices = indices[batch_start:batch_end]
             
             # 构建批量prompt
             prompt = self._build_batch_prompt(batch_items)
@@ -1581,6 +1635,7 @@ START from id=1, classify ALL {len(items)} items:"""
                     # 缓存（多模型共存：不保存importance，因为时效性会变化）
                     cache_key = self._get_cache_key(item)
                     if self.enable_cache:
+                        self._cache_dirty = True
                         self.cache[cache_key] = {
                             'content_type': classified['content_type'],
                             'confidence': classified['confidence'],
@@ -1632,6 +1687,7 @@ START from id=1, classify ALL {len(items)} items:"""
                         # 缓存（多模型共存：不保存importance）
                         cache_key = self._get_cache_key(item)
                         if self.enable_cache:
+                            self._cache_dirty = True
                             self.cache[cache_key] = {
                                 'content_type': classified['content_type'],
                                 'confidence': classified['confidence'],
@@ -1657,8 +1713,8 @@ START from id=1, classify ALL {len(items)} items:"""
                         classified['classified_by'] = 'rule:batch_fallback'
                         results.append((idx, classified))
             
+            completed += len(batch_items)
             if show_progress:
-                completed = min(batch_end, total)
                 batch_time = time.time() - batch_start_time
                 remaining_batches = total_batches - batch_num
                 estimated_remaining = batch_time * remaining_batches
@@ -2012,11 +2068,33 @@ def select_llm_provider() -> Tuple[str, str]:
     return provider, model
 
 
+_status_session: Optional[requests.Session] = None
+
+# 量化标签推荐顺序：Q4_K_M 速度与精度平衡最好，其次 Q5_K_M、Q4_0
+QUANTIZATION_PREFERENCE = ('q4_k_m', 'q5_k_m', 'q4_0')
+
+
+def _quantization_rank(model_name: str) -> int:
+    """模型标签的量化推荐排名（越小越优先，未标注量化的排在最后）"""
+    name = model_name.lower()
+    for rank, tag in enumerate(QUANTIZATION_PREFERENCE):
+        if tag in name:
+            return rank
+    return len(QUANTIZATION_PREFERENCE)
+
+
+def _get_status_session() -> requests.Session:
+    """获取状态检测共用的HTTP会话（保持连接，避免每次轮询重新建连）"""
+    global _status_session
+    if _status_session is None:
+        _status_session = requests.Session()
+    return _status_session
+
+
 def get_available_ollama_models() -> List[str]:
     """获取本地可用的Ollama模型列表"""
     try:
-        import requests
-        response = requests.get('http://localhost:11434/api/tags', timeout=5)
+        response = _get_status_session().get('http://localhost:11434/api/tags', timeout=5)
         if response.status_code == 200:
             data = response.json()
             return [model['name'] for model in data.get('models', [])]
@@ -2036,20 +2114,21 @@ def check_ollama_status() -> Dict:
     }
     
     try:
-        import requests
+        session = _get_status_session()
         
         # 1. 检查Ollama服务是否运行
-        response = requests.get('http://localhost:11434/api/tags', timeout=5)
+        response = session.get('http://localhost:11434/api/tags', timeout=5)
         if response.status_code == 200:
             result['running'] = True
             data = response.json()
             result['models'] = [model['name'] for model in data.get('models', [])]
             
-            # 推荐模型优先级
+            # 推荐模型优先级（同一模型安装了多个量化版本时优先推荐更快的量化标签）
             preferred = ['qwen3:8b', 'llama3.2:3b', 'mistral:7b']
             for model in preferred:
-                if model in result['models']:
-                    result['recommended'] = model
+                variants = [m for m in result['models'] if m == model or m.startswith(model + '-')]
+                if variants:
+                    result['recommended'] = min(variants, key=_quantization_rank)
                     break
             
             if not result['recommended'] and result['models']:
@@ -2057,7 +2136,7 @@ def check_ollama_status() -> Dict:
         
         # 2. 检查当前已加载的模型（ollama ps 等效）
         try:
-            ps_response = requests.get('http://localhost:11434/api/ps', timeout=5)
+            ps_response = session.get('http://localhost:11434/api/ps', timeout=5)
             if ps_response.status_code == 200:
                 ps_data = ps_response.json()
                 loaded = ps_data.get('models', [])
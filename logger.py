@@ -12,13 +12,22 @@
 """
 
 import logging
+import multiprocessing
 import os
+import sys
 import glob
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from logging.handlers import RotatingFileHandler
 
 
+# 是否运行在 multiprocessing 子进程中（包括 forkserver/spawn 启动时以 __mp_main__ 重新导入主模块的阶段，
+# 主进程中 sys.modules['__mp_main__'] 只是 __main__ 的别名）
+# 子进程只输出到控制台：RotatingFileHandler 不支持多进程写同一文件，日志清理也只应由主进程执行
+_IN_CHILD_PROCESS = (multiprocessing.parent_process() is not None
+                     or getattr(sys.modules.get('__mp_main__'), '__name__', None) == '__mp_main__')
+
+
 # ANSI颜色代码
 class Colors:
     """ANSI颜色代码"""
@@ -99,7 +108,7 @@ class AITrackerLogger:
         self._log_dir = 'logs'
         self._log_level = logging.INFO
         self._console_enabled = True
-        self._file_enabled = True
+        self._file_enabled = not _IN_CHILD_PROCESS
         self._max_size_mb = 10
         self._backup_count = 5
         self._retention_days = 30
@@ -134,7 +143,7 @@ class AITrackerLogger:
         self._log_level = getattr(logging, log_level.upper(), logging.INFO)
         self._log_dir = log_dir
         self._console_enabled = console_enabled
-        self._file_enabled = file_enabled
+        self._file_enabled = file_enabled and not _IN_CHILD_PROCESS
         self._max_size_mb = max_size_mb
         self._backup_count = backup_count
         self._retention_days = retention_days
@@ -144,7 +153,8 @@ class AITrackerLogger:
             os.makedirs(self._log_dir)
         
         # 清理过期日志文件
-        self._cleanup_old_logs()
+        if not _IN_CHILD_PROCESS:
+            self._cleanup_old_logs()
         
         # 更新已存在的日志器
         for logger in self._loggers.values():
@@ -161,7 +171,8 @@ class AITrackerLogger:
             import yaml
             if os.path.exists(config_path):
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                    # logger 被 config 模块导入，不能反向复用其缓存；直接使用 libyaml C 解析器（可用时）
+                    config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
                     logging_config = config.get('logging', {})
                     
                     self.configure(
@@ -24,12 +24,22 @@ def _get_exports_dir():
 
 DATA_EXPORTS_DIR = _get_exports_dir()
 
+# 影响趋势统计的字段：审核修改这些字段（或标记垃圾）后才需要重新分析
+TREND_FIELDS = ('content_type', 'tech_categories', 'region')
+
+
+def _trend_snapshot(item: Dict) -> tuple:
+    """提取条目中影响趋势统计的字段值，用于判断审核是否改动了统计结果"""
+    return tuple(tuple(value) if isinstance(value, list) else value
+                 for value in (item.get(field) for field in TREND_FIELDS))
+
 
 class ManualReviewer:
     """人工审核器"""
     
     def __init__(self):
         self.review_history = []
+        self.last_changed_indices = set()  # 最近一次批量审核中统计字段有变化的条目位置（审核前列表中）
         self.valid_categories = ['research', 'developer', 'product', 'market', 'leader', 'community']
     
     def get_items_for_review(self, items: List[Dict], 
@@ -195,7 +205,8 @@ class ManualReviewer:
     
     def batch_review(self, items: List[Dict], 
                     min_confidence: float = 0.6,
-                    auto_skip_high: bool = True) -> List[Dict]:
+                    auto_skip_high: bool = True,
+                    review_items: Optional[List[Dict]] = None) -> List[Dict]:
         """
         批量审核模式
         
@@ -203,11 +214,14 @@ class ManualReviewer:
             items: 所有内容列表
             min_confidence: 置信度阈值
             auto_skip_high: 是否自动跳过高置信度内容
+            review_items: 调用方已按同一阈值筛选出的待审核内容（None时重新筛选）
             
         Returns:
-            审核后的内容列表
+            审核后的内容列表（统计字段有变化的条目位置记录在 last_changed_indices）
         """
-        review_items = self.get_items_for_review(items, min_confidence)
+        self.last_changed_indices = set()
+        if review_items is None:
+            review_items = self.get_items_for_review(items, min_confidence)
         
         if not review_items:
             print("\n✅ 没有需要审核的内容！")
@@ -225,11 +239,15 @@ class ManualReviewer:
         reviewed_count = 0
         modified_count = 0
         spam_count = 0
+        # 待审核项与原列表是同一对象，一次建立位置索引，避免每条都 items.index() 线性查找
+        positions = {id(entry): idx for idx, entry in enumerate(items)}
         
         for i, item in enumerate(review_items, 1):
             print(f"\n[{i}/{len(review_items)}]")
             
             original_category = item.get('content_type')
+            # review_item 会原地修改条目，先记录统计字段
+            original_snapshot = _trend_snapshot(item)
             reviewed_item = self.review_item(item, show_details=True)
             
             if reviewed_item.get('manually_reviewed'):
@@ -241,8 +259,12 @@ class ManualReviewer:
                     modified_count += 1
             
             # 更新原列表中的项
-            item_index = items.index(item)
+            item_index = positions.get(id(item))
+            if item_index is None:
+                item_index = items.index(item)
             items[item_index] = reviewed_item
+            if reviewed_item.get('is_spam') or _trend_snapshot(reviewed_item) != original_snapshot:
+                self.last_changed_indices.add(item_index)
             
             # 每5条询问是否继续
             if i % 5 == 0 and i < len(review_items):
@@ -2,17 +2,15 @@
 import json
 import glob
 import os
-import yaml
+from config import load_yaml_file
 from web_publisher import WebPublisher
 
 # 加载数据目录配置
 def _get_exports_dir():
     exports_dir = 'data/exports'
     try:
-        if os.path.exists('config.yaml'):
-            with open('config.yaml', 'r', encoding='utf-8') as f:
-                cfg = yaml.safe_load(f)
-                exports_dir = cfg.get('data', {}).get('exports_dir', exports_dir)
+        cfg = load_yaml_file('config.yaml')
+        exports_dir = cfg.get('data', {}).get('exports_dir', exports_dir)
     except Exception:
         pass
     return exports_dir
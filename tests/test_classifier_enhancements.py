@@ -95,5 +95,21 @@ def test_enhanced_classifier():
     print(f'测试结果: {correct}/{total} 通过 ({correct/total:.0%})')
     print('='*70)
 
+
+def test_iter_filtered_items_matches_list_version():
+    """生成器过滤结果应与 get_filtered_items 一致"""
+    classifier = ContentClassifier()
+    items = [
+        {'title': 'A', 'content_type': 'research', 'region': 'China', 'tech_categories': ['NLP']},
+        {'title': 'B', 'content_type': 'product', 'region': 'USA', 'tech_categories': ['Computer Vision']},
+        {'title': 'C', 'content_type': 'research', 'region': 'USA', 'tech_categories': ['NLP']},
+    ]
+
+    assert list(classifier.iter_filtered_items(items, content_type='research')) == \
+        classifier.get_filtered_items(items, content_type='research')
+    assert [i['title'] for i in classifier.iter_filtered_items(items, tech_category='NLP', region='USA')] == ['C']
+
+
 if __name__ == '__main__':
     test_enhanced_classifier()
+
@@ -12,7 +12,7 @@ from pathlib import Path
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import ConfigManager, OllamaConfig, AzureOpenAIConfig, ClassifierConfig
+from config import ConfigManager, OllamaConfig, AzureOpenAIConfig, ClassifierConfig, load_yaml_file
 
 
 class TestConfigManager:
@@ -59,6 +59,7 @@ class TestConfigManager:
         assert isinstance(classifier, ClassifierConfig)
         assert classifier.default_mode in ['llm', 'rule']
         assert classifier.max_workers > 0
+        assert classifier.batch_size > 0
         
         print(f"✅ 分类器配置正常: mode={classifier.default_mode}")
     
@@ -83,6 +84,23 @@ class TestConfigManager:
         assert config_manager.config.ollama.default_model == original_model
         
         print("✅ 配置重载功能正常")
+    
+    def test_yaml_file_parsed_once_until_modified(self, tmp_path):
+        """测试YAML配置在文件未修改时复用解析结果，修改后重新解析"""
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text('data:\n  exports_dir: a\n', encoding='utf-8')
+        
+        first = load_yaml_file(str(config_file))
+        assert load_yaml_file(str(config_file)) is first
+        assert first['data']['exports_dir'] == 'a'
+        
+        config_file.write_text('data:\n  exports_dir: b\n', encoding='utf-8')
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_yaml_file(str(config_file))['data']['exports_dir'] == 'b'
+        
+        assert load_yaml_file(str(tmp_path / 'missing.yaml')) == {}
+        print("✅ YAML配置解析缓存正常")
 
 
 class TestConfigDataclasses:
@@ -63,10 +63,10 @@ class TestOllamaStatus:
         
         print(f"✅ 状态检查返回: running={status['running']}, models={len(status.get('models', []))}")
     
-    @patch('llm_classifier.requests.get')
-    def test_check_ollama_status_when_offline(self, mock_get):
+    @patch('llm_classifier._get_status_session')
+    def test_check_ollama_status_when_offline(self, mock_session):
         """测试Ollama离线时的状态"""
-        mock_get.side_effect = Exception("Connection refused")
+        mock_session.return_value.get.side_effect = Exception("Connection refused")
         
         status = check_ollama_status()
         
@@ -74,8 +74,8 @@ class TestOllamaStatus:
         
         print("✅ Ollama离线状态检测正常")
     
-    @patch('llm_classifier.requests.get')
-    def test_check_ollama_status_when_online(self, mock_get):
+    @patch('llm_classifier._get_status_session')
+    def test_check_ollama_status_when_online(self, mock_session):
         """测试Ollama在线时的状态"""
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -85,7 +85,7 @@ class TestOllamaStatus:
             ]
         }
         mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        mock_session.return_value.get.return_value = mock_response
         
         status = check_ollama_status()
         
@@ -93,6 +93,27 @@ class TestOllamaStatus:
         assert len(status['models']) > 0
         
         print("✅ Ollama在线状态检测正常")
+    
+    @patch('llm_classifier._get_status_session')
+    def test_recommend_prefers_fast_quantization(self, mock_session):
+        """测试同一模型有多个量化版本时优先推荐 Q4_K_M"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'models': [
+            {'name': 'qwen3:8b'},
+            {'name': 'qwen3:8b-q8_0'},
+            {'name': 'qwen3:8b-q4_K_M'},
+        ]}
+        ps_response = Mock()
+        ps_response.status_code = 200
+        ps_response.json.return_value = {'models': []}
+        mock_session.return_value.get.side_effect = [mock_response, ps_response]
+        
+        with patch('llm_classifier.detect_gpu', return_value=None):
+            status = check_ollama_status()
+        
+        assert status['recommended'] == 'qwen3:8b-q4_K_M'
+        print("✅ 量化版本推荐正常")
 
 
 class TestLLMClassifierInitialization:
@@ -137,6 +158,32 @@ class TestLLMClassifierInitialization:
             # gpu_info可能是None或GPUInfo对象
             
         print(f"✅ GPU检测完成")
+    
+    def test_pack_batches_fits_context(self):
+        """测试批量分类按长度分箱且每批不超过上下文预算"""
+        from llm_classifier import OllamaOptions, BATCH_PROMPT_BASE_TOKENS, BATCH_ITEM_OUTPUT_TOKENS
+        
+        with patch('llm_classifier.check_ollama_status', return_value={'running': True, 'models': ['qwen3:8b']}):
+            classifier = LLMClassifier(provider='ollama', model='qwen3:8b', batch_size=10,
+                                       auto_detect_gpu=False)
+        classifier.ollama_options = OllamaOptions(num_ctx=2048)
+        
+        short = {'title': 'GPT-5 released', 'summary': 'short', 'source': 'X'}
+        long_zh = {'title': '人工智能' * 20, 'summary': '大模型' * 40, 'source': '36kr'}
+        items = [long_zh, short] * 6
+        batches = classifier._pack_batches(items, list(range(len(items))))
+        
+        # 所有条目恰好出现一次
+        assert sorted(i for _, idx in batches for i in idx) == list(range(len(items)))
+        for batch_items, _ in batches:
+            assert len(batch_items) <= 10
+            used = sum(classifier._estimate_item_tokens(x) + BATCH_ITEM_OUTPUT_TOKENS for x in batch_items)
+            assert used <= 2048 - BATCH_PROMPT_BASE_TOKENS
+        # 按长度排序装箱：短内容排在最前面
+        assert all(x is short for x in batches[0][0][:6])
+        assert len(batches) > 1
+        
+        print(f"✅ 批量分箱正常: {[len(b) for b, _ in batches]}")
 
 
 class TestClassificationMethods:
@@ -217,6 +264,26 @@ class TestCacheManagement:
         
         print("✅ 缓存保存正常")
     
+    def test_save_cache_skips_unchanged(self, tmp_path):
+        """测试缓存未变化时不重写缓存文件"""
+        cache_file = tmp_path / "test_llm_cache.json"
+        
+        with patch('llm_classifier.check_ollama_status', return_value={'running': True, 'models': ['qwen3:8b']}):
+            classifier = LLMClassifier(provider='ollama', model='qwen3:8b', auto_detect_gpu=False)
+        classifier.cache_file = str(cache_file)
+        classifier.cache['test_key'] = {'content_type': 'research'}
+        classifier._save_cache()
+        
+        with patch('builtins.open', side_effect=AssertionError("不应重写缓存")):
+            classifier._save_cache()
+        
+        classifier.cache['another_key'] = {'content_type': 'product'}
+        classifier._save_cache()
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            assert set(json.load(f)) >= {'test_key', 'another_key'}
+        
+        print("✅ 未变化的缓存跳过保存")
+    
     def test_load_cache(self, tmp_path):
         """测试加载缓存"""
         cache_file = tmp_path / "test_llm_cache.json"
@@ -324,6 +391,34 @@ class TestModelUnloading:
         print("✅ 模型卸载执行正常")
 
 
+class TestModelWarmup:
+    """测试模型预热"""
+    
+    def test_concurrent_warmup_loads_once(self):
+        """测试后台预热与首次分类并发调用时只加载一次模型"""
+        import threading
+        import time
+        
+        with patch('llm_classifier.check_ollama_status', return_value={'running': True, 'models': ['qwen3:8b']}):
+            classifier = LLMClassifier(provider='ollama', model='qwen3:8b', auto_detect_gpu=False)
+        
+        def slow_post(*args, **kwargs):
+            time.sleep(0.05)
+            return Mock(status_code=200)
+        
+        with patch.object(classifier.session, 'post', side_effect=slow_post) as mock_post:
+            threads = [threading.Thread(target=classifier.warmup_model) for _ in range(3)]
+            for th in threads:
+                th.start()
+            for th in threads:
+                th.join()
+        
+        assert classifier.is_warmed_up
+        assert mock_post.call_count == 1
+        
+        print("✅ 并发预热只加载一次")
+
+
 class TestCleanup:
     """测试清理"""
     
@@ -13,7 +13,7 @@ from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from TheWorldOfAI import AIWorldTracker, _load_data_paths
+from TheWorldOfAI import AIWorldTracker, _load_data_paths, _remove_files
 
 
 class TestDataPathsLoading:
@@ -108,6 +108,26 @@ class TestConfigManagement:
         
         print("✅ 配置保存成功")
     
+    def test_save_user_config_skips_unchanged(self, tmp_path):
+        """测试配置未变化时不重复写入，且不残留临时文件"""
+        tracker = AIWorldTracker(auto_mode=True)
+        test_config_file = tmp_path / "test_config.json"
+        with patch('TheWorldOfAI.CONFIG_FILE', str(test_config_file)):
+            tracker._save_user_config()
+            first = test_config_file.read_text(encoding='utf-8')
+            
+            with patch('TheWorldOfAI.open', side_effect=AssertionError("不应重复写入")):
+                tracker._save_user_config()
+            
+            tracker.classification_mode = 'llm'
+            tracker._save_user_config()
+            with open(test_config_file, 'r', encoding='utf-8') as f:
+                assert json.load(f)['classification_mode'] == 'llm'
+        
+        assert first
+        assert not (tmp_path / "test_config.json.tmp").exists()
+        print("✅ 未变化的配置跳过写入")
+    
     def test_load_user_config(self, tmp_path):
         """测试加载用户配置"""
         test_config_file = tmp_path / "test_config.json"
@@ -161,6 +181,92 @@ class TestDataProcessing:
         
         print("✅ 趋势数据存储正常")
 
+    def test_trends_memoized_by_data_version(self):
+        """测试数据未变化时复用趋势分析结果"""
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.analyzer = Mock()
+        tracker.analyzer.analyze_trends.side_effect = lambda data: {'total': len(data)}
+
+        tracker.data = [{'title': 'Test 1', 'content_type': 'research'}]
+        assert tracker._analyze_trends() == {'total': 1}
+        assert tracker._analyze_trends() == {'total': 1}
+        assert tracker.analyzer.analyze_trends.call_count == 1
+
+        # 重新赋值数据后需要重新分析
+        tracker.data = tracker.data + [{'title': 'Test 2', 'content_type': 'news'}]
+        assert tracker._analyze_trends() == {'total': 2}
+        assert tracker.analyzer.analyze_trends.call_count == 2
+
+        print("✅ 趋势分析缓存正常")
+
+    def test_statistics_counts(self, capsys):
+        """测试统计信息按类型和地区计数，缺失字段计为unknown"""
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.data = [
+            {'title': 'A', 'content_type': 'research', 'region': 'USA'},
+            {'title': 'B', 'content_type': 'research'},
+        ]
+
+        tracker._show_statistics()
+        output = capsys.readouterr().out
+
+        assert 'research' in output and '2' in output
+        assert 'unknown' in output
+
+        print("✅ 统计信息正常")
+
+    def test_filter_counts_all_and_shows_first_five(self, capsys):
+        """测试筛选结果计数包含全部匹配项，只显示前5条"""
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.data = [{'title': f'R{i}', 'content_type': 'research'} for i in range(7)] + \
+                       [{'title': 'P', 'content_type': 'product'}]
+
+        with patch('builtins.input', side_effect=['1', 'research']):
+            tracker._filter_data()
+        output = capsys.readouterr().out
+
+        from i18n import t
+        assert t('filter_result', count=7) in output
+        assert t('filter_more', count=2) in output
+        assert 'R4' in output and 'R5' not in output
+
+        print("✅ 筛选计数与预览正常")
+
+    def test_classify_skips_duplicate_items(self):
+        """测试内容相同的条目只分类一次且结果顺序不变"""
+        from TheWorldOfAI import _classify_deduplicated
+
+        classify_batch = Mock(side_effect=lambda items: [dict(x, content_type='research', tags=['ai']) for x in items])
+        items = [{'title': 'A', 'url': 'u1'}, {'title': 'B', 'url': 'u1'}, {'title': 'A', 'url': 'u1'}]
+
+        result = _classify_deduplicated(classify_batch, items)
+
+        assert len(classify_batch.call_args[0][0]) == 2
+        assert [x['title'] for x in result] == ['A', 'B', 'A']
+        assert result[0] == result[2] and result[0] is not result[2]
+        # 嵌套对象也是独立副本
+        assert result[0]['tags'] is not result[2]['tags']
+
+        print("✅ 重复条目去重分类正常")
+
+    def test_write_export_reuses_encoded_data(self, tmp_path):
+        """测试导出写入直接使用调用方传入的已编码data"""
+        from TheWorldOfAI import _json_bytes
+
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.data = [{'title': 'Test 1', 'content_type': 'research'}]
+        tracker.trends = {'total': 1}
+        blob = _json_bytes(tracker.data)
+
+        path = tmp_path / 'reviewed.json'
+        with patch('TheWorldOfAI._json_bytes', wraps=_json_bytes) as mock_encode:
+            tracker._write_export(str(path), {'reviewed': True}, blob)
+        saved = json.loads(path.read_text(encoding='utf-8'))
+        assert saved == {'metadata': {'reviewed': True}, 'data': tracker.data, 'trends': {'total': 1}}
+        assert all(call.args[0] is not tracker.data for call in mock_encode.call_args_list)
+
+        print("✅ 导出复用已编码数据正常")
+
 
 class TestCleanup:
     """测试资源清理"""
@@ -189,6 +295,20 @@ class TestCleanup:
         
         print("✅ 清理执行成功")
 
+    def test_cleanup_skips_unused_collector(self):
+        """测试未使用过的采集器在清理时不会被创建"""
+        tracker = AIWorldTracker(auto_mode=True)
+
+        assert tracker._collector is None
+        tracker.cleanup()
+        assert tracker._collector is None
+
+        # 首次访问时才创建
+        assert tracker.collector is not None
+        assert tracker._collector is tracker.collector
+
+        print("✅ 采集器按需初始化")
+
 
 class TestDataExport:
     """测试数据导出功能"""
@@ -211,6 +331,222 @@ class TestDataExport:
         
         print(f"✅ 缓存目录存在: {DATA_CACHE_DIR}")
 
+    def test_save_and_reload_results(self, tmp_path):
+        """测试保存结果后可重新加载（含中文内容）"""
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.data = [
+            {'title': '测试标题', 'content_type': 'research', 'region': 'China'},
+            {'title': 'Test 2', 'content_type': 'product', 'region': 'USA'}
+        ]
+        tracker.trends = {'content_distribution': {'research': 1, 'product': 1}}
+
+        with patch('TheWorldOfAI.DATA_EXPORTS_DIR', str(tmp_path)):
+            tracker._save_results("report")
+
+            data_files = list(tmp_path.glob('ai_tracker_data_*.json'))
+            assert len(data_files) == 1
+            assert '测试标题' in data_files[0].read_text(encoding='utf-8')
+
+            reloaded = AIWorldTracker(auto_mode=True)
+            assert reloaded.data == tracker.data
+            assert reloaded.trends == tracker.trends
+
+        print("✅ 结果保存与重新加载正常")
+
+    def test_pretty_export_is_indented(self, tmp_path):
+        """测试默认导出紧凑JSON，pretty_json 时缩进输出且内容一致"""
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.data = [{'title': '测试标题', 'content_type': 'research'}]
+        tracker.trends = {'total_items': 1}
+
+        compact_file = tmp_path / 'compact.json'
+        pretty_file = tmp_path / 'pretty.json'
+        tracker._write_export(str(compact_file), {'reviewed': True})
+        tracker.pretty_json = True
+        tracker._write_export(str(pretty_file), {'reviewed': True})
+
+        assert '\n' not in compact_file.read_text(encoding='utf-8')
+        assert '\n  ' in pretty_file.read_text(encoding='utf-8')
+        assert json.loads(compact_file.read_text(encoding='utf-8')) == \
+            json.loads(pretty_file.read_text(encoding='utf-8'))
+
+        print("✅ 紧凑/缩进导出正常")
+
+    def test_latest_export_reloaded(self, tmp_path):
+        """测试启动时加载最新导出文件的数据"""
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.data = [{'title': 'Saved', 'content_type': 'research'}]
+        tracker.trends = {'total_items': 1}
+
+        with patch('TheWorldOfAI.DATA_EXPORTS_DIR', str(tmp_path)):
+            tracker._save_results("report")
+            reloaded = AIWorldTracker(auto_mode=True)
+
+        assert reloaded.data == tracker.data
+        assert reloaded.trends == tracker.trends
+
+        print("✅ 最新导出数据加载正常")
+
+    def test_regenerate_writes_report_and_data(self, tmp_path):
+        """测试审核后重新生成：报告（后台线程生成）与数据文件都写入导出目录"""
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.data = [{'title': 'Reviewed', 'content_type': 'research'}]
+        tracker.analyzer = Mock()
+        tracker.analyzer.analyze_trends.return_value = {'total_items': 1}
+        tracker.analyzer.generate_report.return_value = "reviewed report"
+        tracker.visualizer = Mock()
+        tracker.visualizer.visualize_all.return_value = {}
+        tracker.web_publisher = Mock()
+        tracker.web_publisher.generate_html_page.return_value = str(tmp_path / 'index.html')
+
+        with patch('TheWorldOfAI.DATA_EXPORTS_DIR', str(tmp_path)):
+            tracker._regenerate_after_review()
+
+        reports = list(tmp_path.glob('ai_tracker_report_reviewed_*.txt'))
+        assert len(reports) == 1
+        assert reports[0].read_text(encoding='utf-8') == "reviewed report"
+        assert len(list(tmp_path.glob('ai_tracker_data_reviewed_*.json'))) == 1
+        print("✅ 审核后重新生成正常")
+
+    def test_regenerate_without_review_writes_normal_export(self, tmp_path):
+        """测试未审核时重新生成按普通导出保存，不带reviewed标记"""
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.data = [{'title': 'Item', 'content_type': 'research'}]
+        tracker.analyzer = Mock()
+        tracker.analyzer.analyze_trends.return_value = {'total_items': 1}
+        tracker.analyzer.generate_report.return_value = "report"
+        tracker.visualizer = Mock()
+        tracker.visualizer.visualize_all.return_value = {}
+        tracker.web_publisher = Mock()
+        tracker.web_publisher.generate_html_page.return_value = str(tmp_path / 'index.html')
+
+        with patch('TheWorldOfAI.DATA_EXPORTS_DIR', str(tmp_path)):
+            tracker._regenerate_after_review(reviewed=False)
+
+        assert not list(tmp_path.glob('*reviewed*'))
+        data_files = list(tmp_path.glob('ai_tracker_data_*.json'))
+        assert len(data_files) == 1
+        assert 'reviewed' not in json.loads(data_files[0].read_text(encoding='utf-8'))['metadata']
+        assert len(list(tmp_path.glob('ai_tracker_report_*.txt'))) == 1
+        print("✅ 未审核重新生成按普通导出保存")
+
+    def test_clear_review_history_removes_matching_files(self, tmp_path):
+        """测试清除审核记录只删除审核历史和学习报告"""
+        for name in ('review_history_1.json', 'learning_report_1.json', 'ai_tracker_data_1.json'):
+            (tmp_path / name).write_text('{}', encoding='utf-8')
+        tracker = AIWorldTracker(auto_mode=True)
+
+        with patch('TheWorldOfAI.DATA_EXPORTS_DIR', str(tmp_path)), \
+             patch('builtins.input', return_value='y'):
+            tracker._clear_review_history()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['ai_tracker_data_1.json']
+        print("✅ 审核记录清除正常")
+
+    def test_remove_files_parallel_reports_failures_once(self, tmp_path):
+        """测试批量删除：大量文件并发删除，失败项汇总为一条错误"""
+        paths = []
+        for i in range(40):
+            path = tmp_path / f'ai_tracker_report_{i}.txt'
+            path.write_text('x', encoding='utf-8')
+            paths.append(str(path))
+        locked = tmp_path / 'locked'
+        locked.mkdir()
+        paths.append(str(locked))  # 目录无法用 os.remove 删除
+        log_error = Mock()
+
+        deleted = _remove_files(paths, log_error)
+
+        assert deleted == 40
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['locked']
+        log_error.assert_called_once()
+        print("✅ 批量删除正常")
+
+    def test_scan_exports_index(self, tmp_path):
+        """测试导出目录索引按前缀归类并按最新排序"""
+        for name in ('ai_tracker_data_20250101_000000.json',
+                     'ai_tracker_data_20250102_000000.json',
+                     'ai_tracker_data_reviewed_20250103_000000.json',
+                     'review_history_20250103_000000.json',
+                     'ai_tracker_report_20250102_000000.txt'):
+            (tmp_path / name).write_text('{}', encoding='utf-8')
+        # 文件名较旧但修改时间最新的数据文件应被视为最新
+        newest = tmp_path / 'ai_tracker_data_20250101_000000.json'
+        os.utime(newest, (newest.stat().st_atime, newest.stat().st_mtime + 100))
+
+        tracker = AIWorldTracker(auto_mode=True)
+        with patch('TheWorldOfAI.DATA_EXPORTS_DIR', str(tmp_path)):
+            index = tracker._scan_exports()
+
+        names = {k: [os.path.basename(p) for p in v] for k, v in index.items()}
+        assert names['data'][0] == 'ai_tracker_data_reviewed_20250103_000000.json'
+        assert len(names['data']) == 3
+        assert names['reviewed'] == ['ai_tracker_data_reviewed_20250103_000000.json']
+        assert names['reviews'] == ['review_history_20250103_000000.json']
+        assert os.path.basename(index['latest_data']) == 'ai_tracker_data_20250101_000000.json'
+
+        print("✅ 导出目录索引正常")
+
+    def test_group_export_files_matches_glob(self, tmp_path):
+        """测试单次扫描分组结果与逐个 glob 一致"""
+        import glob
+        from TheWorldOfAI import _group_export_files
+
+        for name in ('ai_tracker_data_20250101_000000.json',
+                     'ai_tracker_data_reviewed_20250103_000000.json',
+                     'ai_tracker_report_20250101_000000.txt',
+                     'review_history_20250103_000000.json',
+                     'learning_report_20250103_000000.json',
+                     'notes.txt'):
+            (tmp_path / name).write_text('{}', encoding='utf-8')
+
+        patterns = {'json': 'ai_tracker_data_*.json', 'txt': 'ai_tracker_report_*.txt',
+                    'review': 'review_history_*.json', 'learning': 'learning_report_*.json'}
+        with patch('TheWorldOfAI.DATA_EXPORTS_DIR', str(tmp_path)):
+            groups = _group_export_files(**patterns)
+
+        for key, pattern in patterns.items():
+            assert sorted(groups[key]) == sorted(glob.glob(os.path.join(str(tmp_path), pattern)))
+
+        print("✅ 导出文件分组正常")
+
+    def test_improvement_suggestions_output(self, tmp_path, capsys):
+        """测试改进建议按条目完整输出"""
+        tracker = AIWorldTracker(auto_mode=True)
+        report_file = tmp_path / 'feedback_report.json'
+        report_file.write_text(json.dumps({'improvement_suggestions': [
+            {'type': 'keyword', 'category': 'research', 'issue': 'too broad', 'keywords': ['llm', 'agent']},
+            {'type': 'threshold', 'severity': 'high'},
+        ]}), encoding='utf-8')
+        
+        tracker._show_improvement_suggestions(str(report_file))
+        out = capsys.readouterr().out
+        
+        assert 'too broad' in out and 'llm, agent' in out and 'high' in out
+        assert out.index('research') < out.index('threshold')
+        print("✅ 改进建议输出正常")
+    
+    def test_feedback_loop_reused_for_unchanged_inputs(self, tmp_path):
+        """测试输入文件未变化时复用学习报告"""
+        review_file = tmp_path / 'review_history_20250103_000000.json'
+        data_file = tmp_path / 'ai_tracker_data_reviewed_20250103_000000.json'
+        report_file = tmp_path / 'learning_report_20250103_000000.json'
+        for f in (review_file, data_file, report_file):
+            f.write_text('{}', encoding='utf-8')
+
+        tracker = AIWorldTracker(auto_mode=True)
+        with patch('learning_feedback.create_feedback_loop', return_value=str(report_file)) as loop:
+            assert tracker._run_feedback_loop(str(review_file), str(data_file)) == str(report_file)
+            assert tracker._run_feedback_loop(str(review_file), str(data_file)) == str(report_file)
+            assert loop.call_count == 1
+
+            # 审核文件更新后需要重新分析
+            os.utime(review_file, (review_file.stat().st_atime, review_file.stat().st_mtime + 10))
+            tracker._run_feedback_loop(str(review_file), str(data_file))
+            assert loop.call_count == 2
+
+        print("✅ 学习报告缓存正常")
+
 
 class TestModuleImports:
     """测试模块导入"""
@@ -339,6 +675,54 @@ class TestReviewerIntegration:
         assert tracker.learner is not None
         
         print("✅ 学习反馈模块可用")
+    
+    def test_batch_review_records_changed_items(self):
+        """测试批量审核记录统计字段有变化的条目位置"""
+        from manual_reviewer import ManualReviewer
+        
+        reviewer = ManualReviewer()
+        items = [
+            {'title': 'A', 'content_type': 'research', 'confidence': 0.3},
+            {'title': 'B', 'content_type': 'product', 'confidence': 0.9},
+            {'title': 'C', 'content_type': 'market', 'confidence': 0.2},
+        ]
+        
+        def review(item, show_details=True):
+            item['manually_reviewed'] = True
+            if item['title'] == 'C':
+                item['content_type'] = 'product'
+            return item
+        
+        with patch.object(reviewer, 'review_item', side_effect=review), \
+             patch('builtins.input', return_value='y'), \
+             patch('builtins.print'):
+            reviewer.batch_review(items, min_confidence=0.6)
+        
+        # A 仅确认分类，C 修改了分类
+        assert reviewer.last_changed_indices == {2}
+        print("✅ 审核变更条目记录正常")
+    
+    def test_regenerate_after_unchanged_review_reuses_trends_and_charts(self, tmp_path):
+        """测试审核未改动统计字段时沿用现有趋势和图表"""
+        chart = tmp_path / 'tech_hotspots.png'
+        chart.write_bytes(b'png')
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker.data = [{'title': 'Reviewed', 'content_type': 'research'}]
+        tracker.trends = {'tech_hotspots': {'NLP': 1}, 'total_items': 1}
+        tracker.chart_files = {'tech_hotspots': str(chart)}
+        tracker.analyzer = Mock()
+        tracker.analyzer.generate_report.return_value = "report"
+        tracker.visualizer = Mock()
+        tracker.visualizer.visualize_all.return_value = {'tech_hotspots': str(chart)}
+        tracker.web_publisher = Mock()
+        tracker.web_publisher.generate_html_page.return_value = str(tmp_path / 'index.html')
+        
+        with patch('TheWorldOfAI.DATA_EXPORTS_DIR', str(tmp_path)):
+            tracker._regenerate_after_review(changed_indices=set())
+        
+        tracker.analyzer.analyze_trends.assert_not_called()
+        assert tracker.visualizer.visualize_all.call_args.kwargs['reuse'] == {'tech_hotspots': str(chart)}
+        print("✅ 审核无变化时沿用趋势和图表")
 
 
 class TestAutoMode:
@@ -362,6 +746,177 @@ class TestAutoMode:
         assert tracker.classifier is not None
         
         print("✅ 自动模式使用规则分类器")
+    
+    def test_parse_non_interactive_args(self):
+        """测试非交互模式命令行参数解析"""
+        from TheWorldOfAI import _parse_args
+        
+        args = _parse_args(['--review', '--threshold', '0.7', '--no-browser'])
+        assert args.review and args.no_browser
+        assert args.threshold == 0.7
+        assert not args.auto and not args.regenerate
+        
+        assert _parse_args([]).threshold == 0.6
+        with pytest.raises(SystemExit):
+            _parse_args(['--threshold', '1.5'])
+        with pytest.raises(SystemExit):
+            _parse_args(['--reveiw'])
+        with pytest.raises(SystemExit):
+            _parse_args(['--auto', '--model', 'qwen3:8b'])
+        # 交互模式不接受 --mode，--threshold 只配合 --review
+        with pytest.raises(SystemExit):
+            _parse_args(['--mode', 'llm'])
+        with pytest.raises(SystemExit):
+            _parse_args(['--auto', '--threshold', '0.7'])
+        assert _parse_args(['--auto', '--mode', 'llm', '--model', 'qwen3:8b']).model == 'qwen3:8b'
+        
+        print("✅ 命令行参数解析正常")
+    
+    def test_auto_mode_does_not_prompt_browser(self, tmp_path):
+        """测试自动模式下不询问打开浏览器"""
+        tracker = AIWorldTracker(auto_mode=True)
+        web_file = tmp_path / 'index.html'
+        web_file.write_text('<html></html>', encoding='utf-8')
+        
+        with patch('builtins.input', side_effect=AssertionError("should not prompt")):
+            tracker._ask_open_web_page(str(web_file))
+        
+        print("✅ 自动模式不阻塞等待输入")
+    
+    def test_review_list_output(self, capsys):
+        """测试待审核列表完整输出每条内容"""
+        tracker = AIWorldTracker(auto_mode=True)
+        review_items = [
+            {'title': f'Item {i}', 'content_type': 'research', 'confidence': 0.4, 'source': 'arXiv'}
+            for i in range(1, 4)
+        ]
+        tracker._show_review_list(review_items)
+        out = capsys.readouterr().out
+        
+        assert '[3] Item 3' in out
+        assert out.count('arXiv') == 3
+        print("✅ 待审核列表输出正常")
+    
+    def test_llm_mode_without_ollama_keeps_rule(self, tmp_path):
+        """测试 --mode llm 在Ollama不可用时保持规则模式且不写配置"""
+        from TheWorldOfAI import _parse_args
+        
+        args = _parse_args(['--auto', '--mode', 'llm', '--model', 'qwen3:8b'])
+        assert args.mode == 'llm' and args.model == 'qwen3:8b'
+        
+        tracker = AIWorldTracker(auto_mode=True)
+        config_file = tmp_path / 'config.json'
+        with patch('TheWorldOfAI.check_ollama_status', return_value={'running': False, 'models': []}), \
+             patch('TheWorldOfAI.CONFIG_FILE', str(config_file)), \
+             patch('builtins.input', side_effect=AssertionError("should not prompt")):
+            tracker._enable_llm_non_interactive(args.model)
+        
+        assert tracker.classification_mode == 'rule'
+        assert tracker.llm_classifier is None
+        assert not config_file.exists()
+        print("✅ --mode llm 降级为规则模式")
+
+
+class TestMenuDispatch:
+    """测试主菜单分发"""
+
+    def test_menu_dispatches_choice(self):
+        """测试菜单选项调用对应处理函数，无效输入不崩溃"""
+        tracker = AIWorldTracker(auto_mode=True)
+        tracker._generate_web_page = Mock()
+        tracker._manual_review = Mock()
+
+        with patch('builtins.input', side_effect=['9', '2', '0']):
+            tracker.show_menu()
+
+        tracker._generate_web_page.assert_called_once()
+        tracker._manual_review.assert_not_called()
+
+        print("✅ 菜单分发正常")
+
+
+class TestOllamaStartup:
+    """测试Ollama服务启动"""
+    
+    def test_start_returns_as_soon_as_ready(self):
+        """测试服务就绪后立即返回，无需等满整秒"""
+        tracker = AIWorldTracker(auto_mode=True)
+        statuses = [{'running': False}, {'running': True, 'models': []}]
+        with patch('subprocess.Popen') as mock_popen, \
+             patch('TheWorldOfAI._ollama_port_open', return_value=True), \
+             patch('TheWorldOfAI.check_ollama_status', side_effect=statuses), \
+             patch('time.sleep') as mock_sleep:
+            result = tracker._start_ollama_service(show_progress=False)
+        
+        assert result['success'] is True
+        assert mock_popen.call_count == 1
+        assert mock_popen.call_args.args[0] == ['ollama', 'serve']
+        assert all(call.args[0] < 1 for call in mock_sleep.call_args_list)
+        print("✅ Ollama就绪检测正常")
+    
+    def test_start_poll_backs_off(self):
+        """测试服务未就绪时检测间隔逐步加长且不超过上限"""
+        tracker = AIWorldTracker(auto_mode=True)
+        statuses = [{'running': False}] * 4 + [{'running': True, 'models': []}]
+        with patch('subprocess.Popen'), \
+             patch('TheWorldOfAI._ollama_port_open', return_value=True), \
+             patch('TheWorldOfAI.check_ollama_status', side_effect=statuses), \
+             patch('time.sleep') as mock_sleep:
+            result = tracker._start_ollama_service(show_progress=False)
+        
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert result['success'] is True
+        assert delays == sorted(delays) and delays[0] < delays[-1]
+        assert max(delays) <= 1.0
+        print("✅ Ollama启动检测退避正常")
+    
+    def test_start_probes_port_before_http(self):
+        """测试端口未监听时不发起HTTP状态查询"""
+        tracker = AIWorldTracker(auto_mode=True)
+        with patch('subprocess.Popen'), \
+             patch('TheWorldOfAI._ollama_port_open', side_effect=[False, False, True]), \
+             patch('TheWorldOfAI.check_ollama_status',
+                   return_value={'running': True, 'models': []}) as mock_check, \
+             patch('time.sleep'):
+            result = tracker._start_ollama_service(show_progress=False)
+        
+        assert result['success'] is True
+        assert mock_check.call_count == 1
+        print("✅ Ollama端口探测正常")
+    
+    def test_ollama_status_cached_briefly(self):
+        """测试Ollama状态在有效期内复用，强制刷新时重新检测"""
+        tracker = AIWorldTracker(auto_mode=True)
+        with patch('TheWorldOfAI.check_ollama_status', return_value={'running': False}) as mock_check:
+            tracker._ollama_status()
+            tracker._ollama_status()
+            assert mock_check.call_count == 1
+            tracker._ollama_status(max_age=0)
+            assert mock_check.call_count == 2
+        print("✅ Ollama状态缓存正常")
+    
+    def test_pull_progress_flushed_while_output_pauses(self, monkeypatch):
+        """测试下载进度在子进程暂停输出时也按间隔刷新，结束后输出剩余行"""
+        import io
+        import time
+        from TheWorldOfAI import _relay_progress
+        
+        out = io.StringIO()
+        monkeypatch.setattr(sys, 'stdout', out)
+        seen_during_pause = []
+        
+        def stream():
+            yield 'pulling 10%\n'
+            yield 'pulling 20%\n'
+            time.sleep(0.3)
+            seen_during_pause.append(out.getvalue())
+            yield 'success\n'
+        
+        _relay_progress(stream(), interval=0.1)
+        
+        assert 'pulling 20%' in seen_during_pause[0]
+        assert out.getvalue().endswith('  success\n')
+        print("✅ 下载进度刷新正常")
 
 
 class TestErrorHandling:
@@ -6,6 +6,7 @@
 
 import sys
 import os
+import multiprocessing
 import pytest
 from pathlib import Path
 import tempfile
@@ -129,6 +130,44 @@ class TestDataVisualizer:
         
         assert len(created_files) > 0
         print(f"✅ 创建了 {len(created_files)} 个实际文件")
+    
+    def test_parallel_render_matches_sequential(self, visualizer, sample_trends, monkeypatch):
+        """测试并行渲染与顺序渲染产出相同的图表"""
+        import visualizer as visualizer_module
+        
+        monkeypatch.setattr(visualizer_module, '_can_render_in_parallel', lambda count: False)
+        sequential = visualizer.visualize_all(sample_trends)
+        
+        if 'forkserver' not in multiprocessing.get_all_start_methods():
+            pytest.skip("平台不支持 forkserver，顺序渲染")
+        monkeypatch.setattr(visualizer_module, '_can_render_in_parallel', lambda count: True)
+        try:
+            parallel = visualizer.visualize_all(sample_trends)
+            pool = visualizer_module._render_pool
+            visualizer.visualize_all(sample_trends)
+            # 常驻进程池在多次调用间复用
+            assert pool is not None and visualizer_module._render_pool is pool
+        finally:
+            visualizer_module._shutdown_render_pool()
+        
+        assert list(parallel) == list(sequential)
+        assert all(os.path.exists(f) for f in parallel.values() if f)
+        print(f"✅ 并行渲染生成 {len(parallel)} 个图表")
+    
+    def test_visualize_all_skips_reused_charts(self, visualizer, sample_trends, monkeypatch):
+        """测试指定沿用的图表不重新渲染"""
+        import visualizer as visualizer_module
+        monkeypatch.setattr(visualizer_module, '_can_render_in_parallel', lambda count: False)
+        
+        def fail(trends):
+            raise AssertionError("should reuse")
+        monkeypatch.setattr(visualizer, 'create_dashboard', fail)
+        
+        kept = os.path.join(visualizer.output_dir, 'kept_dashboard.png')
+        files = visualizer.visualize_all(sample_trends, reuse={'dashboard': kept})
+        
+        assert files['dashboard'] == kept
+        print("✅ 沿用图表不重新渲染")
 
 
 class TestWebPublisher:
@@ -151,6 +190,13 @@ class TestWebPublisher:
             'region_distribution': 'visualizations/region_distribution.png'
         }
     
+    def test_sanitize_html(self, publisher):
+        """测试HTML清理：去标签、合并空白、转义特殊字符"""
+        text = '<b>GPT & "Claude"</b>\n\n  it\'s <3'
+        assert publisher._sanitize_html(text) == 'GPT &amp; &quot;Claude&quot; it&#39;s &lt;3'
+        assert publisher._sanitize_html('') == ''
+        print("✅ HTML清理正常")
+    
     def test_publisher_initialization(self, publisher):
         """测试发布器初始化"""
         assert publisher is not None
@@ -14,12 +14,15 @@ matplotlib.use('Agg')
 
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import atexit
+import multiprocessing
 import os
 import platform
 
-from i18n import t, get_language
+from i18n import t, get_language, set_language
 from logger import get_log_helper
 
 # 模块日志器
@@ -96,6 +99,65 @@ def configure_chinese_fonts():
 configure_chinese_fonts()
 
 
+# 趋势字段与对应绘图方法（外加综合仪表板，每次最多渲染 len(CHART_METHODS) + 1 个图表）
+CHART_METHODS = (('tech_hotspots', 'plot_tech_hotspots'),
+                 ('content_distribution', 'plot_content_distribution'),
+                 ('region_distribution', 'plot_region_distribution'),
+                 ('daily_trends', 'plot_daily_trends'))
+
+# 工作进程内按输出目录缓存的可视化实例（每个工作进程每个目录只构造一次）
+_worker_visualizers: Dict[str, 'DataVisualizer'] = {}
+
+# 进程内常驻的图表渲染进程池（首次并行渲染时创建，之后各次 visualize_all 复用）
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _render_chart(output_dir: str, language: str, method_name: str, data) -> str:
+    """在工作进程中渲染单个图表（输出目录与界面语言随任务传入，常驻进程池无需重建）"""
+    set_language(language)
+    visualizer = _worker_visualizers.get(output_dir)
+    if visualizer is None:
+        visualizer = _worker_visualizers[output_dir] = DataVisualizer(output_dir)
+    return getattr(visualizer, method_name)(data)
+
+
+def _can_render_in_parallel(task_count: int) -> bool:
+    """
+    多核、有多个图表且平台支持 forkserver 时才并行渲染
+    
+    不直接从主进程 fork：主进程此时可能还有报告生成、模型预热等线程在运行，
+    fork 会把它们持有的锁带入子进程导致死锁。只有 spawn 的平台（Windows）上，
+    每个工作进程都要重新导入主模块和 matplotlib，开销超过并行收益，因此顺序渲染。
+    """
+    return (task_count > 1 and (os.cpu_count() or 1) > 1
+            and 'forkserver' in multiprocessing.get_all_start_methods())
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """
+    获取常驻渲染进程池，首次调用时创建
+    
+    forkserver 服务进程只预先导入 matplotlib（耗时的部分），不导入本模块：
+    否则日志模块会在服务进程里打开日志文件并被所有工作进程继承。
+    """
+    global _render_pool
+    if _render_pool is None:
+        ctx = multiprocessing.get_context('forkserver')
+        ctx.set_forkserver_preload(['matplotlib.pyplot'])
+        _render_pool = ProcessPoolExecutor(max_workers=min(len(CHART_METHODS) + 1, os.cpu_count() or 1),
+                                           mp_context=ctx)
+        atexit.register(_shutdown_render_pool)
+    return _render_pool
+
+
+def _shutdown_render_pool():
+    """关闭常驻渲染进程池"""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=True, cancel_futures=True)
+        _render_pool = None
+
+
 class DataVisualizer:
     """数据可视化工具"""
     
@@ -470,40 +532,53 @@ class DataVisualizer:
         plt.close()
         return filepath
     
-    def visualize_all(self, trends: Dict) -> Dict[str, str]:
+    def visualize_all(self, trends: Dict, reuse: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """
         生成所有可视化图表
         
         Args:
             trends: 趋势分析数据
+            reuse: 仍然有效、无需重新渲染的图表 {名称: 文件路径}
             
         Returns:
             图表文件路径字典
         """
         log.dual_section(t('vis_start_gen'))
         
-        filepaths = {}
-        
-        # 生成各类图表
-        if trends.get('tech_hotspots'):
-            filepaths['tech_hotspots'] = self.plot_tech_hotspots(trends['tech_hotspots'])
-        
-        if trends.get('content_distribution'):
-            filepaths['content_distribution'] = self.plot_content_distribution(trends['content_distribution'])
-        
-        if trends.get('region_distribution'):
-            filepaths['region_distribution'] = self.plot_region_distribution(trends['region_distribution'])
-        
-        if trends.get('daily_trends'):
-            filepaths['daily_trends'] = self.plot_daily_trends(trends['daily_trends'])
+        # 生成各类图表（各图表相互独立）
+        tasks = []
+        for key, method_name in CHART_METHODS:
+            if trends.get(key):
+                tasks.append((key, method_name, trends[key]))
         
         # 生成综合仪表板
-        filepaths['dashboard'] = self.create_dashboard(trends)
+        tasks.append(('dashboard', 'create_dashboard', trends))
+        
+        reuse = reuse or {}
+        if reuse:
+            log.dual_info(f"♻️ Reusing {len(reuse)} unchanged charts")
+        rendered = self._render_charts([task for task in tasks if task[0] not in reuse])
+        filepaths = {key: reuse[key] if key in reuse else rendered[key] for key, _, _ in tasks}
         
         log.dual_success(t('vis_complete', count=len([f for f in filepaths.values() if f])))
         log.dual_file(t('vis_output_dir', dir=os.path.abspath(self.output_dir)))
         
         return filepaths
+    
+    def _render_charts(self, tasks: List[tuple]) -> Dict[str, str]:
+        """渲染图表任务列表 [(名称, 方法名, 数据)]，条件允许时多进程并行，失败则回退为顺序渲染"""
+        if _can_render_in_parallel(len(tasks)):
+            try:
+                pool = _get_render_pool()
+                language = get_language()
+                futures = [(key, pool.submit(_render_chart, self.output_dir, language, method_name, data))
+                           for key, method_name, data in tasks]
+                return {key: future.result() for key, future in futures}
+            except Exception as e:
+                log.warning(f"Parallel chart rendering failed, falling back to sequential: {e}")
+                _shutdown_render_pool()
+        
+        return {key: getattr(self, method_name)(data) for key, method_name, data in tasks}
 
 
 if __name__ == "__main__":
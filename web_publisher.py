@@ -19,6 +19,17 @@ from logger import get_log_helper
 # 模块日志器
 log = get_log_helper('web_publisher')
 
+# HTML清理用的预编译正则与转义表（每张卡片都会调用，避免重复查找/多次替换）
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HTML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
 
 class WebPublisher:
     """Web网页发布器 - 专业版"""
@@ -53,16 +64,11 @@ class WebPublisher:
         if not text:
             return ""
         # 1. 移除HTML标签 (替换为空格以防单词粘连)
-        clean = re.sub(r'<[^>]+>', ' ', str(text))
+        clean = _HTML_TAG_RE.sub(' ', str(text))
         # 2. 移除多余空白
-        clean = re.sub(r'\s+', ' ', clean).strip()
-        # 3. 转义特殊字符 (顺序很重要)
-        clean = clean.replace('&', '&amp;')
-        clean = clean.replace('<', '&lt;')
-        clean = clean.replace('>', '&gt;')
-        clean = clean.replace('"', '&quot;')
-        clean = clean.replace("'", '&#39;')
-        return clean
+        clean = _WHITESPACE_RE.sub(' ', clean).strip()
+        # 3. 转义特殊字符 (单次遍历，& 不会被重复转义)
+        return clean.translate(_HTML_ESCAPES)
     
     def _parse_date(self, date_str: str) -> datetime:
         """解析各种格式的日期字符串为datetime对象，确保带时区"""